@@ -1,10 +1,14 @@
 """Application configuration via pydantic-settings.
 
 Loads settings from environment variables and .env files.
-Uses @lru_cache for singleton access throughout the application.
+get_settings() returns a module-level singleton built on first use.
+
+The .env file is only consulted when APP_ENV (from the real process
+environment) is unset or "development"; other environments are expected
+to provide configuration as environment variables.
 """
 
-from functools import lru_cache
+import os
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,7 +21,7 @@ class Settings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=".env" if os.environ.get("APP_ENV", "development") == "development" else None,
         env_file_encoding="utf-8",
         case_sensitive=False,
     )
@@ -53,11 +57,19 @@ class Settings(BaseSettings):
     frontend_url: str = "http://localhost:3000"
 
 
-@lru_cache
+_SETTINGS: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Return cached singleton Settings instance.
 
+    Uses a plain module global rather than lru_cache, since this is
+    called from every request handler and service hot path.
+
     Returns:
         Settings: Application configuration loaded from environment.
     """
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
@@ -1,11 +1,16 @@
 """FastAPI dependency injection providers.
 
-Provides singleton service instances via FastAPI's Depends() system.
-Each provider function is designed to be used as a dependency in route handlers.
+All services are process-wide singletons, so they are built once during
+application startup (see app.main.lifespan) and bundled into a single
+AppContainer stored on app.state. Route handlers declare one
+Depends(get_container) instead of resolving each service separately.
 """
 
-from functools import lru_cache
+from dataclasses import dataclass
 
+from fastapi import Request
+
+from app.models.schemas import CrisisResource
 from app.repositories.memory_session import InMemorySessionRepository
 from app.services.anonymizer import Anonymizer
 from app.services.chatbot import ChatbotService
@@ -14,60 +19,59 @@ from app.services.session_service import SessionService
 from app.services.triage_evaluator import TriageEvaluator
 
 
-@lru_cache
-def get_session_repository() -> InMemorySessionRepository:
-    """Provide the singleton session repository.
-
-    Returns:
-        InMemorySessionRepository: Thread-safe in-memory session store.
-    """
-    return InMemorySessionRepository()
+@dataclass(frozen=True, slots=True)
+class AppContainer:
+    """Singleton services shared by all route handlers.
 
-
-@lru_cache
-def get_risk_scorer() -> RiskScorer:
-    """Provide the singleton risk scorer.
-
-    Returns:
-        RiskScorer: Multi-signal risk scoring engine.
+    Args:
+        session_repository: Thread-safe in-memory session store.
+        risk_scorer: Multi-signal risk scoring engine.
+        triage_evaluator: Cascading triage rule engine.
+        anonymizer: PII stripping service.
+        chatbot: LLM orchestrator with response validation.
+        session_service: Session lifecycle management service.
     """
-    return RiskScorer()
 
+    session_repository: InMemorySessionRepository
+    risk_scorer: RiskScorer
+    triage_evaluator: TriageEvaluator
+    anonymizer: Anonymizer
+    chatbot: ChatbotService
+    session_service: SessionService
 
-@lru_cache
-def get_triage_evaluator() -> TriageEvaluator:
-    """Provide the singleton triage evaluator.
 
-    Returns:
-        TriageEvaluator: Cascading triage rule engine.
-    """
-    return TriageEvaluator()
+def build_container(
+    risk_keywords: dict | None = None,
+    crisis_resources: list[CrisisResource] | None = None,
+) -> AppContainer:
+    """Construct all services in dependency order.
 
-
-@lru_cache
-def get_anonymizer() -> Anonymizer:
-    """Provide the singleton anonymizer.
+    Args:
+        risk_keywords: Preloaded keyword tiers for the risk scorer.
+        crisis_resources: Preloaded crisis resources for triage.
 
     Returns:
-        Anonymizer: PII stripping service.
+        AppContainer: Freshly built service container.
     """
-    return Anonymizer()
-
+    session_repository = InMemorySessionRepository()
+    anonymizer = Anonymizer()
+    return AppContainer(
+        session_repository=session_repository,
+        risk_scorer=RiskScorer(keywords=risk_keywords),
+        triage_evaluator=TriageEvaluator(crisis_resources=crisis_resources),
+        anonymizer=anonymizer,
+        chatbot=ChatbotService(anonymizer=anonymizer),
+        session_service=SessionService(repository=session_repository),
+    )
 
-@lru_cache
-def get_chatbot_service() -> ChatbotService:
-    """Provide the singleton chatbot service.
-
-    Returns:
-        ChatbotService: LLM orchestrator with response validation.
-    """
-    return ChatbotService(anonymizer=get_anonymizer())
 
+def get_container(request: Request) -> AppContainer:
+    """Provide the service container built at startup.
 
-def get_session_service() -> SessionService:
-    """Provide a session service instance.
+    Args:
+        request: Incoming request, used to reach the application state.
 
     Returns:
-        SessionService: Session lifecycle management service.
+        AppContainer: Services shared across all requests.
     """
-    return SessionService(repository=get_session_repository())
+    return request.app.state.container
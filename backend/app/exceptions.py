@@ -2,6 +2,12 @@
 
 Each exception type maps to a specific error scenario with
 structured details for logging and client error responses.
+
+The exceptions raised on common request paths (unknown, expired or
+invalid input) keep only their raw fields and build message/details
+on access, so constructing one costs no string formatting or dict.
+Their fields live in __slots__; exception instances still carry an
+instance __dict__, so the slots do not shrink them.
 """
 
 
@@ -13,10 +19,12 @@ class ChatbotBaseException(Exception):
         details: Optional dictionary with additional context for logging.
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict | None = None) -> None:
         self.message = message
-        self.details = details or {}
-        super().__init__(self.message)
+        self.details = details
+        super().__init__(message)
 
     def __str__(self) -> str:
         if self.details:
@@ -31,11 +39,22 @@ class SessionNotFoundException(ChatbotBaseException):
         session_id: The ID that was not found.
     """
 
+    __slots__ = ("session_id",)
+
     def __init__(self, session_id: str) -> None:
-        super().__init__(
-            message=f"Session not found: {session_id}",
-            details={"session_id": session_id},
-        )
+        # Skip the base initializer: message is derived lazily from session_id
+        self.session_id = session_id
+        Exception.__init__(self, session_id)
+
+    @property
+    def message(self) -> str:
+        """Human-readable error description."""
+        return f"Session not found: {self.session_id}"
+
+    @property
+    def details(self) -> dict:
+        """Logging context with the missing session ID."""
+        return {"session_id": self.session_id}
 
 
 class SessionExpiredException(ChatbotBaseException):
@@ -46,14 +65,26 @@ class SessionExpiredException(ChatbotBaseException):
         duration_minutes: How long the session has been active.
     """
 
+    __slots__ = ("session_id", "duration_minutes")
+
     def __init__(self, session_id: str, duration_minutes: float) -> None:
-        super().__init__(
-            message=f"Session expired: {session_id}",
-            details={
-                "session_id": session_id,
-                "duration_minutes": round(duration_minutes, 1),
-            },
-        )
+        # Skip the base initializer: message and details are derived lazily
+        self.session_id = session_id
+        self.duration_minutes = duration_minutes
+        Exception.__init__(self, session_id, duration_minutes)
+
+    @property
+    def message(self) -> str:
+        """Human-readable error description."""
+        return f"Session expired: {self.session_id}"
+
+    @property
+    def details(self) -> dict:
+        """Logging context with the rounded session duration."""
+        return {
+            "session_id": self.session_id,
+            "duration_minutes": round(self.duration_minutes, 1),
+        }
 
 
 class InvalidMessageException(ChatbotBaseException):
@@ -63,11 +94,22 @@ class InvalidMessageException(ChatbotBaseException):
         reason: Description of why the message is invalid.
     """
 
+    __slots__ = ("reason",)
+
     def __init__(self, reason: str) -> None:
-        super().__init__(
-            message=f"Invalid message: {reason}",
-            details={"reason": reason},
-        )
+        # Skip the base initializer: message and details are derived lazily
+        self.reason = reason
+        Exception.__init__(self, reason)
+
+    @property
+    def message(self) -> str:
+        """Human-readable error description."""
+        return f"Invalid message: {self.reason}"
+
+    @property
+    def details(self) -> dict:
+        """Logging context with the rejection reason."""
+        return {"reason": self.reason}
 
 
 class RiskScoringException(ChatbotBaseException):
@@ -78,10 +120,12 @@ class RiskScoringException(ChatbotBaseException):
         session_id: The session where scoring failed.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, session_id: str | None = None) -> None:
         super().__init__(
             message=message,
-            details={"session_id": session_id} if session_id else {},
+            details={"session_id": session_id} if session_id else None,
         )
 
 
@@ -93,6 +137,8 @@ class LLMProviderException(ChatbotBaseException):
         message: Description of the provider error.
     """
 
+    __slots__ = ()
+
     def __init__(self, provider: str, message: str) -> None:
         super().__init__(
             message=f"LLM provider error ({provider}): {message}",
@@ -108,8 +154,10 @@ class TriageException(ChatbotBaseException):
         session_id: The session where triage failed.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, session_id: str | None = None) -> None:
         super().__init__(
             message=message,
-            details={"session_id": session_id} if session_id else {},
+            details={"session_id": session_id} if session_id else None,
         )
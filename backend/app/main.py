@@ -8,14 +8,16 @@ Creates and configures the FastAPI application with:
 """
 
 import logging
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.config import get_settings
+from app.dependencies import build_container
 from app.exceptions import (
     ChatbotBaseException,
     InvalidMessageException,
@@ -23,10 +25,36 @@ from app.exceptions import (
     SessionNotFoundException,
 )
 from app.routers import chat, health
+from app.services.risk_scorer import load_risk_keywords
+from app.services.triage_evaluator import load_crisis_resources
 from app.utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Pre-serialized error bodies; templates only splice in the JSON-encoded detail
+SESSION_NOT_FOUND_BODY = b'{"detail":"Session not found","error_code":"SESSION_NOT_FOUND"}'
+SESSION_EXPIRED_TEMPLATE = b'{"detail":%b,"error_code":"SESSION_EXPIRED"}'
+INVALID_MESSAGE_TEMPLATE = b'{"detail":%b,"error_code":"INVALID_MESSAGE"}'
+INTERNAL_ERROR_BODY = b'{"detail":"An internal error occurred","error_code":"INTERNAL_ERROR"}'
+
+# Lifespans of mounted sub-applications (MCP, metrics, ...). Each is entered
+# exactly once inside the main lifespan, in registration order, and exited
+# in reverse order on shutdown.
+_SUB_LIFESPANS: list[Callable[[FastAPI], AbstractAsyncContextManager]] = []
+
+
+def register_sub_lifespan(
+    sub_lifespan: Callable[[FastAPI], AbstractAsyncContextManager],
+) -> None:
+    """Register a sub-application lifespan to run inside the main lifespan.
+
+    Args:
+        sub_lifespan: Lifespan factory taking the FastAPI app, as accepted
+            by FastAPI(lifespan=...).
+    """
+    if sub_lifespan not in _SUB_LIFESPANS:
+        _SUB_LIFESPANS.append(sub_lifespan)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -46,10 +74,98 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         settings.app_version,
         settings.app_env,
     )
-    yield
+
+    # Parse data files and build services once, before the first request
+    app.state.risk_keywords = load_risk_keywords(settings.risk_keywords_path)
+    app.state.crisis_resources = load_crisis_resources(settings.crisis_resources_path)
+    app.state.container = build_container(
+        risk_keywords=app.state.risk_keywords,
+        crisis_resources=app.state.crisis_resources,
+    )
+
+    async with AsyncExitStack() as stack:
+        # Registered first so the pooled client closes last, even on errors
+        stack.push_async_callback(app.state.container.chatbot.aclose)
+        for sub_lifespan in _SUB_LIFESPANS:
+            await stack.enter_async_context(sub_lifespan(app))
+        yield
     logger.info("Shutting down %s", settings.app_name)
 
 
+async def session_not_found_handler(
+    request: Request, exc: SessionNotFoundException,
+) -> Response:
+    """Render SessionNotFoundException as a 404 response.
+
+    Args:
+        request: The request that raised the exception.
+        exc: The raised exception.
+
+    Returns:
+        JSON error response.
+    """
+    logger.info("Session not found: session_id=%s", exc.session_id)
+    return Response(
+        content=SESSION_NOT_FOUND_BODY, status_code=404, media_type="application/json",
+    )
+
+
+async def session_expired_handler(
+    request: Request, exc: SessionExpiredException,
+) -> Response:
+    """Render SessionExpiredException as a 410 response.
+
+    Args:
+        request: The request that raised the exception.
+        exc: The raised exception.
+
+    Returns:
+        JSON error response.
+    """
+    return Response(
+        content=SESSION_EXPIRED_TEMPLATE % orjson.dumps(exc.message),
+        status_code=410,
+        media_type="application/json",
+    )
+
+
+async def invalid_message_handler(
+    request: Request, exc: InvalidMessageException,
+) -> Response:
+    """Render InvalidMessageException as a 400 response.
+
+    Args:
+        request: The request that raised the exception.
+        exc: The raised exception.
+
+    Returns:
+        JSON error response.
+    """
+    return Response(
+        content=INVALID_MESSAGE_TEMPLATE % orjson.dumps(exc.message),
+        status_code=400,
+        media_type="application/json",
+    )
+
+
+async def chatbot_base_handler(
+    request: Request, exc: ChatbotBaseException,
+) -> Response:
+    """Render any other ChatbotBaseException as a generic 500 response.
+
+    Args:
+        request: The request that raised the exception.
+        exc: The raised exception.
+
+    Returns:
+        JSON error response.
+    """
+    logger.error("Unhandled chatbot exception: %s", exc)
+    return Response(
+        content=INTERNAL_ERROR_BODY, status_code=500, media_type="application/json",
+    )
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -65,20 +181,7 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    _configure_cors(application, settings)
-    _register_exception_handlers(application)
-    _include_routers(application)
-
-    return application
-
-
-def _configure_cors(application: FastAPI, settings) -> None:
-    """Add CORS middleware for frontend communication.
-
-    Args:
-        application: FastAPI app to configure.
-        settings: Application settings with frontend URL.
-    """
+    # CORS for frontend communication
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[settings.frontend_url],
@@ -87,60 +190,24 @@ def _configure_cors(application: FastAPI, settings) -> None:
         allow_headers=["*"],
     )
 
+    # Structured error responses for custom exceptions
+    application.add_exception_handler(SessionNotFoundException, session_not_found_handler)
+    application.add_exception_handler(SessionExpiredException, session_expired_handler)
+    application.add_exception_handler(InvalidMessageException, invalid_message_handler)
+    application.add_exception_handler(ChatbotBaseException, chatbot_base_handler)
 
-def _register_exception_handlers(application: FastAPI) -> None:
-    """Register custom exception handlers for structured error responses.
+    # API routers with versioned prefix
+    application.include_router(health.router, prefix="/api/v1")
+    application.include_router(chat.router, prefix="/api/v1")
 
-    Args:
-        application: FastAPI app to register handlers on.
-    """
+    def openapi() -> dict:
+        # Chat request schemas are built on first use, not at import
+        chat.add_openapi_schemas()
+        return FastAPI.openapi(application)
 
-    @application.exception_handler(SessionNotFoundException)
-    async def session_not_found_handler(
-        request: Request, exc: SessionNotFoundException,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=404,
-            content={"detail": exc.message, "error_code": "SESSION_NOT_FOUND"},
-        )
-
-    @application.exception_handler(SessionExpiredException)
-    async def session_expired_handler(
-        request: Request, exc: SessionExpiredException,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=410,
-            content={"detail": exc.message, "error_code": "SESSION_EXPIRED"},
-        )
-
-    @application.exception_handler(InvalidMessageException)
-    async def invalid_message_handler(
-        request: Request, exc: InvalidMessageException,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=400,
-            content={"detail": exc.message, "error_code": "INVALID_MESSAGE"},
-        )
-
-    @application.exception_handler(ChatbotBaseException)
-    async def chatbot_base_handler(
-        request: Request, exc: ChatbotBaseException,
-    ) -> JSONResponse:
-        logger.error("Unhandled chatbot exception: %s", exc)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "An internal error occurred", "error_code": "INTERNAL_ERROR"},
-        )
-
-
-def _include_routers(application: FastAPI) -> None:
-    """Mount API routers with versioned prefix.
+    application.openapi = openapi
 
-    Args:
-        application: FastAPI app to mount routers on.
-    """
-    application.include_router(health.router, prefix="/api/v1")
-    application.include_router(chat.router, prefix="/api/v1")
+    return application
 
 
 app = create_app()
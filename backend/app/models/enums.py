@@ -5,6 +5,7 @@ are defined here to prevent magic strings and enable type safety.
 """
 
 from enum import Enum
+from typing import Literal
 
 
 class RiskLevel(str, Enum):
@@ -27,6 +28,11 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
 
 
+# Plain-string form of MessageRole for API schemas; validated by pydantic-core
+# without an Enum round-trip
+MessageRoleValue = Literal["user", "assistant", "system"]
+
+
 class HandoffReason(str, Enum):
     """Reasons for handing off to a human professional.
 
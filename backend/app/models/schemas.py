@@ -1,14 +1,20 @@
 """Pydantic v2 request and response schemas.
 
-Every field uses Field() with description and example values.
-Every model includes json_schema_extra for OpenAPI documentation.
+Every field uses Field() with description and example values, which
+is all OpenAPI needs; model-level example dicts are deliberately omitted.
 """
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
-from app.models.enums import RiskLevel
+from app.models.enums import MessageRoleValue, RiskLevel
+
+# Validation constraints live on reusable annotated types; Field() calls
+# below carry documentation only.
+UserMessageText = Annotated[str, StringConstraints(min_length=1, max_length=2000)]
+RiskScoreValue = Annotated[int, Field(ge=0, le=100)]
 
 
 class ChatRequest(BaseModel):
@@ -19,25 +25,11 @@ class ChatRequest(BaseModel):
         description="Existing session ID to continue a conversation. Omit to create a new session.",
         examples=["sess_a1b2c3d4"],
     )
-    user_message: str = Field(
-        ...,
-        min_length=1,
-        max_length=2000,
+    user_message: UserMessageText = Field(
         description="The user's message text. Must be between 1 and 2000 characters.",
         examples=["I've been feeling stressed lately"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "session_id": None,
-                    "user_message": "I've been feeling stressed lately",
-                }
-            ]
-        }
-    }
-
 
 class CrisisResource(BaseModel):
     """Emergency mental health resource for Mexico."""
@@ -63,25 +55,11 @@ class CrisisResource(BaseModel):
         examples=["Free national crisis hotline"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Linea de la Vida",
-                    "number": "800-911-2000",
-                    "hours": "24/7",
-                    "type": "hotline",
-                    "description": "Free national crisis hotline",
-                }
-            ]
-        }
-    }
-
 
 class MessageEntry(BaseModel):
     """Single message in a conversation history."""
 
-    role: str = Field(
+    role: MessageRoleValue = Field(
         description="Message author role: user, assistant, or system.",
         examples=["user"],
     )
@@ -99,19 +77,6 @@ class MessageEntry(BaseModel):
         examples=["2024-01-15T10:30:00Z"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "role": "user",
-                    "content": "I've been feeling overwhelmed at work",
-                    "risk_score": 25,
-                    "timestamp": "2024-01-15T10:30:00Z",
-                }
-            ]
-        }
-    }
-
 
 class ChatResponse(BaseModel):
     """Response returned after processing a chat message."""
@@ -124,10 +89,8 @@ class ChatResponse(BaseModel):
         description="The chatbot's response text.",
         examples=["I hear you. It sounds like you've been carrying a lot."],
     )
-    risk_score: int = Field(
+    risk_score: RiskScoreValue = Field(
         description="Computed risk score for the user's message (0-100).",
-        ge=0,
-        le=100,
         examples=[15],
     )
     risk_level: RiskLevel = Field(
@@ -155,24 +118,6 @@ class ChatResponse(BaseModel):
         examples=["2024-01-15T10:30:00Z"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "session_id": "sess_a1b2c3d4",
-                    "bot_response": "I hear you. It sounds like you've been carrying a lot.",
-                    "risk_score": 15,
-                    "risk_level": "low",
-                    "triage_activated": False,
-                    "human_handoff": False,
-                    "crisis_resources": None,
-                    "session_message_count": 1,
-                    "timestamp": "2024-01-15T10:30:00Z",
-                }
-            ]
-        }
-    }
-
 
 class SessionHistoryResponse(BaseModel):
     """Full conversation history for a session."""
@@ -201,21 +146,6 @@ class SessionHistoryResponse(BaseModel):
         examples=["2024-01-15T10:00:00Z"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "session_id": "sess_a1b2c3d4",
-                    "history": [],
-                    "message_count": 0,
-                    "cumulative_risk": 0,
-                    "triage_activated": False,
-                    "created_at": "2024-01-15T10:00:00Z",
-                }
-            ]
-        }
-    }
-
 
 class HandoffResponse(BaseModel):
     """Response when a session is handed off to a professional."""
@@ -233,21 +163,6 @@ class HandoffResponse(BaseModel):
         examples=[{"message_count": 5, "risk_level": "high"}],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "session_id": "sess_a1b2c3d4",
-                    "handoff_status": "initiated",
-                    "professional_context": {
-                        "message_count": 5,
-                        "risk_level": "high",
-                    },
-                }
-            ]
-        }
-    }
-
 
 class HealthResponse(BaseModel):
     """Health check endpoint response."""
@@ -269,19 +184,6 @@ class HealthResponse(BaseModel):
         examples=[3],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "status": "healthy",
-                    "service": "AI Clinical Chatbot MVP",
-                    "version": "0.1.0",
-                    "active_sessions": 3,
-                }
-            ]
-        }
-    }
-
 
 class ErrorResponse(BaseModel):
     """Standard error response body."""
@@ -296,13 +198,10 @@ class ErrorResponse(BaseModel):
         examples=["SESSION_NOT_FOUND"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "detail": "Session not found",
-                    "error_code": "SESSION_NOT_FOUND",
-                }
-            ]
-        }
-    }
+
+# Pre-built pydantic-core validator/serializer for the chat hot path.
+# The chat router calls these directly instead of going through FastAPI's
+# per-request body validation and response_model re-serialization.
+CHAT_REQUEST_VALIDATOR = ChatRequest.__pydantic_validator__
+CHAT_RESPONSE_SERIALIZER = ChatResponse.__pydantic_serializer__
+HANDOFF_RESPONSE_SERIALIZER = HandoffResponse.__pydantic_serializer__
@@ -2,17 +2,37 @@
 
 Stores conversation history, risk tracking, and triage state
 for a single user session. Used by the repository layer.
+
+Message history is kept column-wise (parallel lists of roles, contents,
+per-message risk scores and timestamps) rather than as a list of record objects.
+Record-shaped access is available through MessageView; the most recent
+messages are also kept as ready-made views in a bounded ring buffer.
 """
 
+from array import array
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime
+from itertools import islice
+from typing import NamedTuple
+
+from app.models.enums import MessageRole, RiskLevel, TriageStatus
 
-from app.models.enums import RiskLevel, TriageStatus
+# Size of Session.recent; covers the LLM context window and handoff summary
+RECENT_MESSAGES_MAXLEN = 10
 
+# Contribution of each risk level to Session.high_risk_count
+_HIGH_RISK_INCREMENT: dict[RiskLevel, int] = {
+    RiskLevel.LOW: 0,
+    RiskLevel.MEDIUM: 0,
+    RiskLevel.HIGH: 1,
+    RiskLevel.CRITICAL: 1,
+}
 
-@dataclass
-class MessageRecord:
-    """Single message stored in a session's history.
+
+class MessageView(NamedTuple):
+    """Read-only view of a single message in a session's history.
 
     Args:
         role: Message author role (user/assistant/system).
@@ -21,21 +41,25 @@ class MessageRecord:
         timestamp: UTC timestamp of the message.
     """
 
-    role: str
+    role: MessageRole
     content: str
-    risk_score: int | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    risk_score: int | None
+    timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Conversation session holding all state for one user interaction.
 
     Args:
         id: Unique session identifier.
-        messages: Ordered list of messages in this conversation.
-        risk_scores: List of risk scores from user messages for trend analysis.
+        roles: Author role of each message, in conversation order.
+        contents: Text of each message, in conversation order.
+        message_risk_scores: Risk score of each message, aligned with the
+            other columns (None for bot messages).
+        timestamps: POSIX timestamp of each message.
         cumulative_risk: Running sum of all risk scores.
+        scored_message_count: Number of messages that carry a risk score.
         current_risk_level: Most recent risk classification.
         triage_status: Current triage state.
         triage_activated: Whether triage has been triggered at least once.
@@ -43,46 +67,124 @@ class Session:
         high_risk_count: Number of messages that scored HIGH or CRITICAL.
         created_at: UTC timestamp when session was created.
         last_activity: UTC timestamp of the most recent message.
+
+    created_at_ts and last_activity_ts mirror the two datetimes as POSIX
+    seconds so duration arithmetic is a single float subtraction.
+    encoded_history caches the JSON encoding of each message for the
+    history endpoint; since history is append-only it never goes stale.
+    recent holds MessageViews of the last RECENT_MESSAGES_MAXLEN messages,
+    seeded from any columns passed to the constructor.
     """
 
     id: str
-    messages: list[MessageRecord] = field(default_factory=list)
-    risk_scores: list[int] = field(default_factory=list)
+    roles: list[MessageRole] = field(default_factory=list)
+    contents: list[str] = field(default_factory=list)
+    message_risk_scores: list[int | None] = field(default_factory=list)
+    timestamps: array = field(default_factory=lambda: array("d"))
     cumulative_risk: int = 0
+    scored_message_count: int = 0
     current_risk_level: RiskLevel = RiskLevel.LOW
     triage_status: TriageStatus = TriageStatus.NONE
     triage_activated: bool = False
     human_handoff: bool = False
     high_risk_count: int = 0
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_activity: datetime = field(init=False)
+    created_at_ts: float = field(init=False)
+    last_activity_ts: float = field(init=False)
+    encoded_history: list[bytes] = field(default_factory=list, init=False, repr=False)
+    recent: deque[MessageView] = field(
+        default_factory=lambda: deque(maxlen=RECENT_MESSAGES_MAXLEN), init=False, repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        # A new session has had no activity since creation; reuse that clock read
+        self.last_activity = self.created_at
+        self.created_at_ts = self.created_at.timestamp()
+        self.last_activity_ts = self.created_at_ts
+        # Columns passed in pre-filled (e.g. a rehydrated session) seed the buffer
+        count = len(self.roles)
+        self.recent.extend(
+            self.get_message(index)
+            for index in range(max(count - RECENT_MESSAGES_MAXLEN, 0), count)
+        )
 
     @property
     def message_count(self) -> int:
         """Return total number of messages in this session."""
-        return len(self.messages)
+        return len(self.roles)
+
+    @property
+    def risk_scores(self) -> list[int]:
+        """Return the risk scores of user messages, in conversation order."""
+        return [score for score in self.message_risk_scores if score is not None]
 
     @property
     def duration_minutes(self) -> float:
         """Return session duration in minutes from creation to last activity."""
-        delta = self.last_activity - self.created_at
-        return delta.total_seconds() / 60.0
+        return (self.last_activity_ts - self.created_at_ts) / 60.0
+
+    def __iter__(self) -> Iterator[MessageView]:
+        """Iterate over the conversation history in order."""
+        for index in range(len(self.roles)):
+            yield self.get_message(index)
+
+    def get_message(self, index: int) -> MessageView:
+        """Build a record-shaped view of one message.
 
-    def add_message(self, role: str, content: str, risk_score: int | None = None) -> None:
+        Args:
+            index: Position in the history; negative values count from the end.
+
+        Returns:
+            MessageView for the requested message.
+        """
+        return MessageView(
+            role=self.roles[index],
+            content=self.contents[index],
+            risk_score=self.message_risk_scores[index],
+            timestamp=datetime.fromtimestamp(self.timestamps[index], UTC),
+        )
+
+    def recent_messages(self, limit: int) -> list[MessageView]:
+        """Return views of the most recent messages, oldest first.
+
+        Args:
+            limit: Maximum number of messages to return.
+
+        Returns:
+            Up to ``limit`` MessageView objects.
+        """
+        if limit <= RECENT_MESSAGES_MAXLEN:
+            return list(islice(self.recent, max(len(self.recent) - limit, 0), None))
+        count = len(self.roles)
+        return [self.get_message(index) for index in range(max(count - limit, 0), count)]
+
+    def add_message(
+        self, role: MessageRole | str, content: str, risk_score: int | None = None,
+    ) -> None:
         """Append a message to the session history and update tracking.
 
         Args:
-            role: Message author role.
+            role: Message author role; plain strings are coerced to MessageRole.
             content: Message text.
             risk_score: Risk score for user messages.
         """
-        record = MessageRecord(role=role, content=content, risk_score=risk_score)
-        self.messages.append(record)
-        self.last_activity = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
+        now_ts = now.timestamp()
+        role = MessageRole(role)
+        # roles goes last: message_count is len(roles), so a reader bounded
+        # by it never sees a row whose other columns are not filled yet
+        self.contents.append(content)
+        self.message_risk_scores.append(risk_score)
+        self.timestamps.append(now_ts)
+        self.roles.append(role)
+        self.recent.append(MessageView(role, content, risk_score, now))
+        self.last_activity = now
+        self.last_activity_ts = now_ts
 
         if risk_score is not None:
-            self.risk_scores.append(risk_score)
             self.cumulative_risk += risk_score
+            self.scored_message_count += 1
 
     def update_risk(self, risk_level: RiskLevel) -> None:
         """Update current risk level and track high-risk occurrences.
@@ -91,5 +193,4 @@ class Session:
             risk_level: The new risk classification for the session.
         """
         self.current_risk_level = risk_level
-        if risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL):
-            self.high_risk_count += 1
+        self.high_risk_count += _HIGH_RISK_INCREMENT[risk_level]
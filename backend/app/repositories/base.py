@@ -2,6 +2,10 @@
 
 Defines the interface that all session storage implementations must follow.
 Uses Python Protocol for structural subtyping (no inheritance required).
+
+The protocol is for static type checking only. Do not add
+@runtime_checkable or isinstance() checks against it: those walk every
+protocol member on each call and nothing at runtime needs them.
 """
 
 from typing import Protocol
@@ -1,31 +1,92 @@
 """Thread-safe in-memory session repository.
 
-Stores sessions in a dictionary protected by threading.Lock.
-Implements automatic expiry checking on read operations.
+Stores sessions in a fixed number of dictionary shards, each protected
+by its own threading.Lock, so concurrent requests for different sessions
+rarely contend on the same mutex.
+Implements automatic expiry checking on read operations; each shard also
+keeps a min-heap of expiry deadlines so sweeps only touch expired entries.
 Suitable for development and single-instance deployments.
 """
 
+import heapq
 import logging
+import secrets
 import threading
-import uuid
-from datetime import datetime, timezone
+import time
 
 from app.config import get_settings
 from app.models.session import Session
 
 logger = logging.getLogger(__name__)
 
+# Number of independently locked shards; must be a power of two
+_SHARDS = 16
+
 
 class InMemorySessionRepository:
     """In-memory session store with thread-safe access.
 
-    Uses threading.Lock to ensure safe concurrent reads and writes.
+    Sessions are spread over _SHARDS dictionaries by hash of their ID.
+    Each shard has its own threading.Lock guarding inserts, expiry
+    evictions and sweeps. Operations that touch a single key once take no
+    lock at all, because dict.get and dict.pop are atomic under the GIL:
+    reading a live session, deleting one, and updating a session that is
+    already stored. Removals done under the lock therefore use pop rather
+    than del, since an unlocked delete may have won the race. A
+    free-threaded (PEP 703) build would need to revisit this.
     Expired sessions are detected on access and automatically removed.
+
+    A session's deadline is fixed at creation, so each shard keeps a heap
+    of (expires_at_ts, session_id) pushed whenever a session object enters
+    the bucket. count_active pops only the expired heads instead of
+    scanning every session. Heap entries for sessions deleted early are
+    left in place and discarded when they reach the head.
     """
 
     def __init__(self) -> None:
-        self._sessions: dict[str, Session] = {}
-        self._lock = threading.Lock()
+        # Settings are fixed for the process lifetime; resolve the limit once
+        self._max_age_seconds = get_settings().max_session_duration_minutes * 60.0
+        self._buckets: list[dict[str, Session]] = [{} for _ in range(_SHARDS)]
+        self._locks = [threading.Lock() for _ in range(_SHARDS)]
+        self._expiry_heaps: list[list[tuple[float, str]]] = [[] for _ in range(_SHARDS)]
+
+    def _shard_index(self, session_id: str) -> int:
+        """Return the index of the shard responsible for a session ID.
+
+        Args:
+            session_id: Unique session identifier.
+
+        Returns:
+            Shard index in [0, _SHARDS).
+        """
+        return hash(session_id) & (_SHARDS - 1)
+
+    def _shard(self, session_id: str) -> tuple[dict[str, Session], threading.Lock]:
+        """Return the bucket and lock responsible for a session ID.
+
+        Args:
+            session_id: Unique session identifier.
+
+        Returns:
+            Tuple of (bucket dictionary, bucket lock).
+        """
+        index = self._shard_index(session_id)
+        return self._buckets[index], self._locks[index]
+
+    def _store(self, index: int, session: Session) -> None:
+        """Insert a session into its bucket. Must be called within the shard lock.
+
+        Args:
+            index: Shard index for the session.
+            session: Session to store.
+        """
+        bucket = self._buckets[index]
+        if bucket.get(session.id) is not session:
+            heapq.heappush(
+                self._expiry_heaps[index],
+                (session.created_at_ts + self._max_age_seconds, session.id),
+            )
+        bucket[session.id] = session
 
     def get(self, session_id: str) -> Session | None:
         """Retrieve a session by ID, returning None if expired or missing.
@@ -36,17 +97,20 @@ class InMemorySessionRepository:
         Returns:
             Session if found and not expired, None otherwise.
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
+        bucket, lock = self._shard(session_id)
+        session = bucket.get(session_id)
+        if session is None:
+            return None
 
-            if self._is_expired(session):
-                logger.info("Session expired, removing: session_id=%s", session_id)
-                del self._sessions[session_id]
-                return None
+        if self._is_expired(session, time.time()):
+            with lock:
+                # Another thread may have removed or replaced it meanwhile
+                if bucket.get(session_id) is session:
+                    logger.info("Session expired, removing: session_id=%s", session_id)
+                    bucket.pop(session_id, None)
+            return None
 
-            return session
+        return session
 
     def create(self, session: Session) -> Session:
         """Store a new session.
@@ -57,8 +121,9 @@ class InMemorySessionRepository:
         Returns:
             The persisted session.
         """
-        with self._lock:
-            self._sessions[session.id] = session
+        index = self._shard_index(session.id)
+        with self._locks[index]:
+            self._store(index, session)
             logger.info("Session created: session_id=%s", session.id)
             return session
 
@@ -71,8 +136,13 @@ class InMemorySessionRepository:
         Returns:
             The updated session.
         """
-        with self._lock:
-            self._sessions[session.id] = session
+        index = self._shard_index(session.id)
+        # Sessions are stored by reference, so in-place mutations are already
+        # visible; only a new or evicted object needs to be written back.
+        if self._buckets[index].get(session.id) is session:
+            return session
+        with self._locks[index]:
+            self._store(index, session)
             return session
 
     def delete(self, session_id: str) -> bool:
@@ -84,12 +154,11 @@ class InMemorySessionRepository:
         Returns:
             True if the session was found and deleted, False otherwise.
         """
-        with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                logger.info("Session deleted: session_id=%s", session_id)
-                return True
+        bucket = self._buckets[self._shard_index(session_id)]
+        if bucket.pop(session_id, None) is None:
             return False
+        logger.info("Session deleted: session_id=%s", session_id)
+        return True
 
     def count_active(self) -> int:
         """Count currently active (non-expired) sessions.
@@ -97,9 +166,13 @@ class InMemorySessionRepository:
         Returns:
             Number of active sessions.
         """
-        with self._lock:
-            self._cleanup_expired()
-            return len(self._sessions)
+        total = 0
+        now_ts = time.time()
+        for index in range(_SHARDS):
+            with self._locks[index]:
+                self._cleanup_expired(index, now_ts)
+                total += len(self._buckets[index])
+        return total
 
     def get_or_create(self, session_id: str | None) -> Session:
         """Retrieve an existing session or create a new one.
@@ -115,30 +188,35 @@ class InMemorySessionRepository:
             if session is not None:
                 return session
 
-        new_id = f"sess_{uuid.uuid4().hex[:12]}"
+        new_id = "sess_" + secrets.token_hex(6)
         new_session = Session(id=new_id)
         return self.create(new_session)
 
-    def _is_expired(self, session: Session) -> bool:
+    def _is_expired(self, session: Session, now_ts: float) -> bool:
         """Check if a session has exceeded the maximum duration.
 
         Args:
             session: Session to check.
+            now_ts: Current POSIX timestamp.
 
         Returns:
             True if the session has expired.
         """
-        settings = get_settings()
-        now = datetime.now(timezone.utc)
-        elapsed = (now - session.created_at).total_seconds() / 60.0
-        return elapsed > settings.max_session_duration_minutes
-
-    def _cleanup_expired(self) -> None:
-        """Remove all expired sessions from storage. Must be called within lock."""
-        expired_ids = [
-            sid for sid, session in self._sessions.items()
-            if self._is_expired(session)
-        ]
-        for sid in expired_ids:
-            del self._sessions[sid]
-            logger.info("Expired session cleaned up: session_id=%s", sid)
+        return now_ts - session.created_at_ts > self._max_age_seconds
+
+    def _cleanup_expired(self, index: int, now_ts: float) -> None:
+        """Remove expired sessions from one shard. Must be called within its lock.
+
+        Args:
+            index: Shard index to sweep.
+            now_ts: Current POSIX timestamp, shared by the whole sweep.
+        """
+        bucket = self._buckets[index]
+        heap = self._expiry_heaps[index]
+        while heap and heap[0][0] < now_ts:
+            _, sid = heapq.heappop(heap)
+            session = bucket.get(sid)
+            # The entry may be stale: deleted, or replaced by a newer session
+            if session is not None and self._is_expired(session, now_ts):
+                bucket.pop(sid, None)
+                logger.info("Expired session cleaned up: session_id=%s", sid)
@@ -5,42 +5,167 @@ triage evaluation, LLM response generation, and real-time streaming.
 """
 
 import asyncio
-import json
 import logging
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
-
-from app.dependencies import (
-    get_anonymizer,
-    get_chatbot_service,
-    get_risk_scorer,
-    get_session_service,
-    get_triage_evaluator,
-)
-from app.services.anonymizer import Anonymizer
-from app.exceptions import SessionExpiredException, SessionNotFoundException
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import UTC, datetime
+
+import orjson
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+
+from app.dependencies import AppContainer, get_container
 from app.models.enums import MessageRole
 from app.models.schemas import (
+    CHAT_REQUEST_VALIDATOR,
+    CHAT_RESPONSE_SERIALIZER,
+    HANDOFF_RESPONSE_SERIALIZER,
     ChatRequest,
     ChatResponse,
     ErrorResponse,
     HandoffResponse,
-    MessageEntry,
     SessionHistoryResponse,
 )
-from app.services.chatbot import ChatbotService
-from app.services.risk_scorer import RiskScorer
-from app.services.session_service import SessionService
-from app.services.triage_evaluator import TriageEvaluator
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# Delay between streamed tokens for natural reading feel
-STREAM_TOKEN_DELAY_SECONDS = 0.03
+# Streamed tokens are coalesced into one SSE frame until either limit is hit
+STREAM_BATCH_TOKENS = 8
+STREAM_FLUSH_INTERVAL_SECONDS = 0.03
+
+# Prefix ChatbotService.stream_response puts on a validator replacement
+REPLACE_MARKER = "__REPLACE__"
+
+# Request bodies are validated manually (see _parse_chat_request), so the
+# ChatRequest schema is attached to the OpenAPI operation explicitly. The
+# schema dict starts empty and is filled by add_openapi_schemas() the first
+# time the OpenAPI document is generated, not at import.
+_CHAT_REQUEST_SCHEMA: dict = {}
+CHAT_REQUEST_OPENAPI = {
+    "requestBody": {
+        "content": {"application/json": {"schema": _CHAT_REQUEST_SCHEMA}},
+        "required": True,
+    },
+}
+
+
+def add_openapi_schemas() -> None:
+    """Fill in the request body schema shared by the chat operations."""
+    if not _CHAT_REQUEST_SCHEMA:
+        _CHAT_REQUEST_SCHEMA.update(ChatRequest.model_json_schema())
+
+
+# Fixed framing of the per-token events; only the content is encoded per frame
+_TOKEN_FRAME_PREFIX = b'data: {"type":"token","content":'
+_REPLACE_FRAME_PREFIX = b'data: {"type":"replace","content":'
+_FRAME_SUFFIX = b"}\n\n"
+
+
+def _sse_event(data: dict) -> bytes:
+    """Encode one Server-Sent Events data frame.
+
+    Args:
+        data: JSON-serializable event payload.
+
+    Returns:
+        The encoded ``data: ...`` frame, terminated by a blank line.
+    """
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _coalesce_tokens(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Group streamed tokens into batches of text.
+
+    A batch is emitted once STREAM_BATCH_TOKENS tokens are buffered, or once
+    STREAM_FLUSH_INTERVAL_SECONDS have passed since the previous batch. The
+    interval is enforced with a timeout, so buffered tokens are sent even
+    while the upstream is stalled. Replacement markers are passed through
+    unchanged and discard anything still buffered. If the upstream fails,
+    the buffered text is emitted before the error is re-raised.
+
+    Args:
+        tokens: Token stream from ChatbotService.stream_response.
+
+    Yields:
+        Joined token batches, or replacement markers.
+    """
+    pending: list[str] = []
+    last_flush = time.monotonic()
+    next_token: asyncio.Future | None = None
+    try:
+        while True:
+            if next_token is None:
+                next_token = asyncio.ensure_future(anext(tokens))
+            timeout = None
+            if pending:
+                timeout = max(last_flush + STREAM_FLUSH_INTERVAL_SECONDS - time.monotonic(), 0)
+            # asyncio.wait (unlike wait_for) leaves the pending read running
+            done, _ = await asyncio.wait((next_token,), timeout=timeout)
+            if not done:
+                yield "".join(pending)
+                pending.clear()
+                last_flush = time.monotonic()
+                continue
+
+            finished, next_token = next_token, None
+            try:
+                token = finished.result()
+            except StopAsyncIteration:
+                break
+            if token.startswith(REPLACE_MARKER):
+                pending.clear()
+                yield token
+                continue
+
+            pending.append(token)
+            now = time.monotonic()
+            if (
+                len(pending) >= STREAM_BATCH_TOKENS
+                or now - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS
+            ):
+                yield "".join(pending)
+                pending.clear()
+                last_flush = now
+        if pending:
+            yield "".join(pending)
+    except Exception:
+        if pending:
+            yield "".join(pending)
+        raise
+    finally:
+        # The upstream generator cannot be closed while a read is in flight
+        if next_token is not None:
+            next_token.cancel()
+            await asyncio.wait((next_token,))
+        await tokens.aclose()
+
+
+async def _parse_chat_request(request: Request) -> ChatRequest:
+    """Validate the raw request body against ChatRequest.
+
+    Uses the pre-built pydantic-core validator directly, skipping
+    FastAPI's per-request body parsing and validation wrapper.
+
+    Args:
+        request: Incoming HTTP request.
+
+    Returns:
+        The validated ChatRequest.
+
+    Raises:
+        RequestValidationError: If the body is not a valid ChatRequest.
+    """
+    try:
+        return CHAT_REQUEST_VALIDATOR.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)],
+        ) from exc
 
 
 @router.post(
@@ -49,136 +174,140 @@ STREAM_TOKEN_DELAY_SECONDS = 0.03
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
     summary="Send a chat message",
     description="Process a user message through the full pipeline and return the response.",
+    openapi_extra=CHAT_REQUEST_OPENAPI,
 )
 async def send_message(
-    request: ChatRequest,
-    session_service: SessionService = Depends(get_session_service),
-    risk_scorer: RiskScorer = Depends(get_risk_scorer),
-    triage_evaluator: TriageEvaluator = Depends(get_triage_evaluator),
-    chatbot: ChatbotService = Depends(get_chatbot_service),
-    anonymizer: Anonymizer = Depends(get_anonymizer),
-) -> ChatResponse:
+    request: Request,
+    container: AppContainer = Depends(get_container),
+) -> Response:
     """Process a user message and return the bot response.
 
     Args:
-        request: Chat request with session ID and message.
-        session_service: Injected session service.
-        risk_scorer: Injected risk scoring engine.
-        triage_evaluator: Injected triage evaluator.
-        chatbot: Injected chatbot service.
-        anonymizer: Injected PII anonymizer.
+        request: Raw HTTP request carrying a ChatRequest JSON body.
+        container: Injected service container.
 
     Returns:
-        ChatResponse with bot response and risk assessment.
+        JSON-encoded ChatResponse with bot response and risk assessment.
 
     Raises:
-        HTTPException: On session errors or processing failures.
+        SessionNotFoundException: If the session does not exist.
+        SessionExpiredException: If the session has expired.
     """
-    try:
-        session = session_service.get_or_create(request.session_id)
-
-        # Risk scoring uses the raw message for accurate keyword detection
-        risk_score = risk_scorer.compute(request.user_message, session)
-        risk_level = risk_scorer.classify(risk_score)
-
-        # Anonymize PII before storing in session (session must never hold raw PII)
-        safe_message = anonymizer.anonymize(request.user_message)
+    chat_request = await _parse_chat_request(request)
+    session_service = container.session_service
+    risk_scorer = container.risk_scorer
+    anonymizer = container.anonymizer
+    triage_evaluator = container.triage_evaluator
+    chatbot = container.chatbot
+    session = session_service.get_or_create(chat_request.session_id)
+
+    # Risk scoring uses the raw message for accurate keyword detection
+    # Lowercased once and shared by the risk scorer and triage rules
+    lower_message = chat_request.user_message.lower()
+    risk_score = risk_scorer.compute(chat_request.user_message, session, lower_message)
+    risk_level = risk_scorer.classify(risk_score)
 
-        session = session_service.add_user_message(
-            session, safe_message, risk_score, risk_level,
-        )
+    # Anonymize PII before storing in session (session must never hold raw PII)
+    safe_message = anonymizer.anonymize(chat_request.user_message)
 
-        triage = triage_evaluator.evaluate(
-            request.user_message, risk_score, risk_level, session,
-        )
+    session = session_service.add_user_message(
+        session, safe_message, risk_score, risk_level,
+    )
 
-        if triage.triage_activated:
-            session_service.mark_triage_activated(session)
-        if triage.human_handoff:
-            session_service.mark_handoff(session)
+    triage = triage_evaluator.evaluate(
+        chat_request.user_message, risk_score, risk_level, session, lower_message,
+    )
 
-        if triage.override_response:
-            bot_response = triage.override_response
-        else:
-            bot_response = await chatbot.generate_response(request.user_message, session)
+    if triage.triage_activated:
+        session_service.mark_triage_activated(session)
+    if triage.human_handoff:
+        session_service.mark_handoff(session)
 
-        session_service.add_bot_message(session, bot_response)
+    if triage.override_response:
+        bot_response = triage.override_response
+    else:
+        bot_response = await chatbot.generate_response(
+            chat_request.user_message, session, lower_message,
+        )
 
-        crisis_resources_data = None
-        if triage.crisis_resources:
-            crisis_resources_data = triage.crisis_resources
+    session_service.add_bot_message(session, bot_response)
 
-        logger.info(
-            "Chat processed: session_id=%s, risk_score=%d, risk_level=%s, "
-            "triage=%s, handoff=%s",
-            session.id, risk_score, risk_level.value,
-            triage.triage_activated, triage.human_handoff,
-        )
+    crisis_resources_data = None
+    if triage.crisis_resources:
+        crisis_resources_data = triage.crisis_resources
 
-        return ChatResponse(
-            session_id=session.id,
-            bot_response=bot_response,
-            risk_score=risk_score,
-            risk_level=risk_level,
-            triage_activated=triage.triage_activated,
-            human_handoff=triage.human_handoff,
-            crisis_resources=crisis_resources_data,
-            session_message_count=session.message_count,
-            timestamp=datetime.now(timezone.utc),
-        )
+    logger.info(
+        "Chat processed: session_id=%s, risk_score=%d, risk_level=%s, "
+        "triage=%s, handoff=%s",
+        session.id, risk_score, risk_level.value,
+        triage.triage_activated, triage.human_handoff,
+    )
 
-    except SessionExpiredException as exc:
-        raise HTTPException(status_code=410, detail=str(exc)) from exc
-    except SessionNotFoundException as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    # All fields are produced by our own pipeline; skip re-validation
+    response = ChatResponse.model_construct(
+        session_id=session.id,
+        bot_response=bot_response,
+        risk_score=risk_score,
+        risk_level=risk_level,
+        triage_activated=triage.triage_activated,
+        human_handoff=triage.human_handoff,
+        crisis_resources=crisis_resources_data,
+        session_message_count=session.message_count,
+        timestamp=datetime.now(UTC),
+    )
+    return Response(
+        content=CHAT_RESPONSE_SERIALIZER.to_json(response),
+        media_type="application/json",
+    )
 
 
 @router.post(
     "/stream",
     summary="Stream a chat response via SSE",
-    description="Process a user message and stream the response word by word via Server-Sent Events.",
+    description="Process a user message and stream the response in token batches via Server-Sent Events.",
+    openapi_extra=CHAT_REQUEST_OPENAPI,
 )
 async def stream_message(
-    request: ChatRequest,
-    session_service: SessionService = Depends(get_session_service),
-    risk_scorer: RiskScorer = Depends(get_risk_scorer),
-    triage_evaluator: TriageEvaluator = Depends(get_triage_evaluator),
-    chatbot: ChatbotService = Depends(get_chatbot_service),
-    anonymizer: Anonymizer = Depends(get_anonymizer),
+    request: Request,
+    container: AppContainer = Depends(get_container),
 ) -> StreamingResponse:
     """Stream a chat response via Server-Sent Events.
 
     SSE event types:
     - metadata: Session info, risk score, triage status
     - crisis: Crisis resources (when applicable)
-    - token: Individual word of the response
+    - token: Next chunk of the response (up to STREAM_BATCH_TOKENS tokens)
     - done: Stream complete with message count
 
     Args:
-        request: Chat request with session ID and message.
-        session_service: Injected session service.
-        risk_scorer: Injected risk scoring engine.
-        triage_evaluator: Injected triage evaluator.
-        chatbot: Injected chatbot service.
-        anonymizer: Injected PII anonymizer.
+        request: Raw HTTP request carrying a ChatRequest JSON body.
+        container: Injected service container.
 
     Returns:
         StreamingResponse with SSE event stream.
     """
-    session = session_service.get_or_create(request.session_id)
+    chat_request = await _parse_chat_request(request)
+    session_service = container.session_service
+    risk_scorer = container.risk_scorer
+    anonymizer = container.anonymizer
+    triage_evaluator = container.triage_evaluator
+    chatbot = container.chatbot
+
+    session = session_service.get_or_create(chat_request.session_id)
 
-    risk_score = risk_scorer.compute(request.user_message, session)
+    lower_message = chat_request.user_message.lower()
+    risk_score = risk_scorer.compute(chat_request.user_message, session, lower_message)
     risk_level = risk_scorer.classify(risk_score)
 
     # Anonymize PII before storing in session
-    safe_message = anonymizer.anonymize(request.user_message)
+    safe_message = anonymizer.anonymize(chat_request.user_message)
 
     session = session_service.add_user_message(
         session, safe_message, risk_score, risk_level,
     )
 
     triage = triage_evaluator.evaluate(
-        request.user_message, risk_score, risk_level, session,
+        chat_request.user_message, risk_score, risk_level, session, lower_message,
     )
 
     if triage.triage_activated:
@@ -201,42 +330,43 @@ async def stream_message(
             "triage_activated": triage.triage_activated,
             "human_handoff": triage.human_handoff,
         }
-        yield f"data: {json.dumps(metadata)}\n\n"
+        yield _sse_event(metadata)
 
         if triage.crisis_resources:
             crisis_data = {
                 "type": "crisis",
                 "resources": [r.model_dump() for r in triage.crisis_resources],
             }
-            yield f"data: {json.dumps(crisis_data)}\n\n"
+            yield _sse_event(crisis_data)
 
         bot_response = ""
         try:
             if triage.override_response:
-                # Triage override: fake-stream the canned response
+                # Triage override: the canned response is sent in word batches
                 words = triage.override_response.split(" ")
-                for i, word in enumerate(words):
-                    token = word + (" " if i < len(words) - 1 else "")
-                    yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
-                    await asyncio.sleep(STREAM_TOKEN_DELAY_SECONDS)
+                for start in range(0, len(words), STREAM_BATCH_TOKENS):
+                    end = start + STREAM_BATCH_TOKENS
+                    chunk = " ".join(words[start:end]) + (" " if end < len(words) else "")
+                    yield _TOKEN_FRAME_PREFIX + orjson.dumps(chunk) + _FRAME_SUFFIX
                 bot_response = triage.override_response
             else:
-                # Stream tokens from the LLM in real time
-                async for token in chatbot.stream_response(request.user_message, session):
-                    if token.startswith("__REPLACE__"):
-                        # Validation replaced the response
-                        replacement = token[len("__REPLACE__"):]
-                        replace_data = {"type": "replace", "content": replacement}
-                        yield f"data: {json.dumps(replace_data)}\n\n"
-                        bot_response = replacement
-                    else:
-                        bot_response += token
-                        token_data = {"type": "token", "content": token}
-                        yield f"data: {json.dumps(token_data)}\n\n"
+                # Stream tokens from the LLM, coalescing bursts into one frame
+                batches = _coalesce_tokens(
+                    chatbot.stream_response(chat_request.user_message, session, lower_message),
+                )
+                async with aclosing(batches):
+                    async for batch in batches:
+                        if batch.startswith(REPLACE_MARKER):
+                            replacement = batch[len(REPLACE_MARKER):]
+                            yield _REPLACE_FRAME_PREFIX + orjson.dumps(replacement) + _FRAME_SUFFIX
+                            bot_response = replacement
+                            continue
+                        bot_response += batch
+                        yield _TOKEN_FRAME_PREFIX + orjson.dumps(batch) + _FRAME_SUFFIX
         except Exception as exc:
             logger.error("Stream error: session_id=%s, error=%s", session.id, exc)
             error_data = {"type": "error", "message": "Something went wrong. Please try again."}
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _sse_event(error_data)
 
         if bot_response:
             session_service.add_bot_message(session, bot_response)
@@ -245,7 +375,7 @@ async def stream_message(
             "type": "done",
             "session_message_count": session.message_count,
         }
-        yield f"data: {json.dumps(done_data)}\n\n"
+        yield _sse_event(done_data)
 
     return StreamingResponse(
         event_generator(),
@@ -265,45 +395,72 @@ async def stream_message(
     summary="Get session history",
     description="Retrieve the full conversation history for a session.",
 )
-def get_history(
+async def get_history(
     session_id: str,
-    session_service: SessionService = Depends(get_session_service),
-) -> SessionHistoryResponse:
+    container: AppContainer = Depends(get_container),
+) -> Response:
     """Return the full conversation history for a session.
 
     Args:
         session_id: Session identifier.
-        session_service: Injected session service.
+        container: Injected service container.
 
     Returns:
-        SessionHistoryResponse with ordered message list.
+        JSON-encoded SessionHistoryResponse with ordered message list.
 
     Raises:
-        HTTPException: If session is not found.
+        SessionNotFoundException: If the session does not exist.
     """
-    try:
-        session = session_service.get_session(session_id)
-    except SessionNotFoundException as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    history = [
-        MessageEntry(
-            role=msg.role,
-            content=msg.content,
-            risk_score=msg.risk_score,
-            timestamp=msg.timestamp,
-        )
-        for msg in session.messages
-    ]
+    session = container.session_service.get_session(session_id)
 
-    return SessionHistoryResponse(
-        session_id=session.id,
-        history=history,
-        message_count=session.message_count,
-        cumulative_risk=session.cumulative_risk,
-        triage_activated=session.triage_activated,
-        created_at=session.created_at,
+    body = orjson.dumps(
+        {
+            "session_id": session.id,
+            "message_count": session.message_count,
+            "cumulative_risk": session.cumulative_risk,
+            "triage_activated": session.triage_activated,
+            "created_at": session.created_at,
+        },
+        option=orjson.OPT_UTC_Z,
     )
+    return Response(
+        content=body[:-1] + b',"history":' + _encode_history(session) + b"}",
+        media_type="application/json",
+    )
+
+
+def _encode_history(session) -> bytes:
+    """Encode a session's history as a JSON array.
+
+    Serialized straight from the session columns; SessionHistoryResponse
+    only documents the shape, no per-message models are built. Each message
+    is encoded once and kept in session.encoded_history, so repeated reads
+    only encode messages added since the previous call.
+
+    Args:
+        session: Session whose history to encode.
+
+    Returns:
+        JSON array of message entries.
+    """
+    encoded = session.encoded_history
+    count = session.message_count
+    start = len(encoded)
+    # Runs on the event loop (the history route is async), the same thread
+    # that appends messages, so the columns cannot change mid-encode.
+    encoded[start:] = [
+        orjson.dumps(
+            {
+                "role": session.roles[index].value,
+                "content": session.contents[index],
+                "risk_score": session.message_risk_scores[index],
+                "timestamp": datetime.fromtimestamp(session.timestamps[index], UTC),
+            },
+            option=orjson.OPT_UTC_Z,
+        )
+        for index in range(start, count)
+    ]
+    return b"[" + b",".join(encoded[:count]) + b"]"
 
 
 @router.post(
@@ -313,10 +470,10 @@ def get_history(
     summary="Trigger manual handoff",
     description="Manually initiate a professional handoff for a session.",
 )
-def trigger_handoff(
+async def trigger_handoff(
     session_id: str,
-    session_service: SessionService = Depends(get_session_service),
-) -> HandoffResponse:
+    container: AppContainer = Depends(get_container),
+) -> Response:
     """Manually trigger a professional handoff for a session.
 
     Builds a professional context summary including conversation
@@ -324,31 +481,32 @@ def trigger_handoff(
 
     Args:
         session_id: Session identifier.
-        session_service: Injected session service.
+        container: Injected service container.
 
     Returns:
-        HandoffResponse with professional context.
+        JSON-encoded HandoffResponse with professional context.
 
     Raises:
-        HTTPException: If session is not found.
+        SessionNotFoundException: If the session does not exist.
     """
-    try:
-        session = session_service.get_session(session_id)
-    except SessionNotFoundException as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    session = container.session_service.get_session(session_id)
 
-    session_service.mark_handoff(session)
-    session_service.mark_triage_activated(session)
+    container.session_service.mark_handoff(session)
+    container.session_service.mark_triage_activated(session)
 
     professional_context = _build_professional_context(session)
 
     logger.info("Manual handoff triggered: session_id=%s", session.id)
 
-    return HandoffResponse(
+    response = HandoffResponse.model_construct(
         session_id=session.id,
         handoff_status="initiated",
         professional_context=professional_context,
     )
+    return Response(
+        content=HANDOFF_RESPONSE_SERIALIZER.to_json(response),
+        media_type="application/json",
+    )
 
 
 def _build_professional_context(session) -> dict:
@@ -360,7 +518,7 @@ def _build_professional_context(session) -> dict:
     Returns:
         Dictionary with conversation summary and risk information.
     """
-    recent_messages = session.messages[-5:] if session.messages else []
+    recent_messages = session.recent_messages(5)
     return {
         "session_id": session.id,
         "message_count": session.message_count,
@@ -370,11 +528,7 @@ def _build_professional_context(session) -> dict:
         "high_risk_count": session.high_risk_count,
         "triage_activated": session.triage_activated,
         "recent_messages": [
-            {
-                "role": msg.role,
-                "content": msg.content,
-                "risk_score": msg.risk_score,
-            }
+            {"role": msg.role.value, "content": msg.content, "risk_score": msg.risk_score}
             for msg in recent_messages
         ],
     }
@@ -6,9 +6,8 @@ Provides service status information for monitoring and load balancers.
 from fastapi import APIRouter, Depends
 
 from app.config import get_settings
-from app.dependencies import get_session_service
+from app.dependencies import AppContainer, get_container
 from app.models.schemas import HealthResponse
-from app.services.session_service import SessionService
 
 router = APIRouter(tags=["health"])
 
@@ -20,12 +19,12 @@ router = APIRouter(tags=["health"])
     description="Returns service status, version, and active session count.",
 )
 def health_check(
-    session_service: SessionService = Depends(get_session_service),
+    container: AppContainer = Depends(get_container),
 ) -> HealthResponse:
     """Return current service health status.
 
     Args:
-        session_service: Injected session service for active session count.
+        container: Injected service container for active session count.
 
     Returns:
         HealthResponse with service status information.
@@ -35,5 +34,5 @@ def health_check(
         status="healthy",
         service=settings.app_name,
         version=settings.app_version,
-        active_sessions=session_service.count_active(),
+        active_sessions=container.session_service.count_active(),
     )
@@ -2,7 +2,9 @@
 
 Strips personally identifiable information from user messages
 before they are processed by the LLM or stored in logs.
-Uses compiled regex patterns for performance.
+Uses compiled regex patterns for performance: a cheap trigger pattern
+rules out most PII-free messages in a single scan, and only the rest are
+run through the per-type replacement passes.
 
 Supported PII types:
 - Email addresses
@@ -18,7 +20,7 @@ logger = logging.getLogger(__name__)
 
 # Compiled patterns for each PII type
 _EMAIL_PATTERN = re.compile(
-    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+    r"\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
 )
 
 _PHONE_PATTERN = re.compile(
@@ -29,17 +31,35 @@ _PHONE_PATTERN = re.compile(
 )
 
 _NAME_PATTERN = re.compile(
-    r"(?:my name is|i'?m|me llamo|soy)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
+    r"(?:my name is|i'?m|me llamo|soy)\s++([A-Z][a-z]+(?:\s++[A-Z][a-z]+)?)",
     re.IGNORECASE,
 )
 
+# Up to four letter runs (each 2+ letters, separated by single whitespace)
+# before the street suffix. Equivalent to repeating "[A-Z][a-z]+\s?" under
+# IGNORECASE, but unambiguous: that form can split one long word into
+# segments in exponentially many ways and backtrack catastrophically.
+# Possessive quantifiers mark runs that can never need to give back input.
 _ADDRESS_PATTERN = re.compile(
-    r"\b\d{1,5}\s+(?:[A-Z][a-z]+\s?){1,4}"
+    r"\b\d{1,5}+\s++[a-z]{2,}(?:\s[a-z]{2,}){0,3}\s?"
     r"(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr"
     r"|Lane|Ln|Court|Ct|Calle|Avenida|Av)\b",
     re.IGNORECASE,
 )
 
+# Cheap necessary condition for any of the patterns above to match: emails
+# need "@", phones and addresses need a digit, and names need one of the
+# identity phrases (matched here from its first letter). Starting with a
+# plain character set lets re skip ahead instead of trying a case-folded
+# alternation at every position. The set lists every character that
+# re.IGNORECASE folds to i, s or m, so nothing the patterns match is missed.
+# Replacement still runs type by type: a single leftmost-match pass would
+# resolve overlapping matches differently (e.g. a name swallowing the start
+# of an email) and leak part of the PII.
+_PII_TRIGGER_PATTERN = re.compile(
+    r"[@\d]|[iIİısSſmM](?i:y name is|'?m|e llamo|oy)\s"
+)
+
 
 class Anonymizer:
     """Strips PII from text using compiled regex patterns.
@@ -56,8 +76,13 @@ class Anonymizer:
             text: Raw user message that may contain PII.
 
         Returns:
-            Anonymized text with PII replaced by placeholders.
+            Anonymized text with PII replaced by placeholders. Messages that
+            cannot contain PII (no "@", no digit, no identity phrase) are
+            returned as the same object without running any replacement.
         """
+        if _PII_TRIGGER_PATTERN.search(text) is None:
+            return text
+
         result = text
         pii_found = False
 
@@ -87,8 +112,8 @@ class Anonymizer:
         Returns:
             Tuple of (modified text, whether any emails were found).
         """
-        new_text = _EMAIL_PATTERN.sub("[EMAIL]", text)
-        return new_text, new_text != text
+        new_text, count = _EMAIL_PATTERN.subn("[EMAIL]", text)
+        return new_text, count > 0
 
     def _replace_phones(self, text: str) -> tuple[str, bool]:
         """Replace phone numbers with [PHONE].
@@ -99,8 +124,8 @@ class Anonymizer:
         Returns:
             Tuple of (modified text, whether any phones were found).
         """
-        new_text = _PHONE_PATTERN.sub("[PHONE]", text)
-        return new_text, new_text != text
+        new_text, count = _PHONE_PATTERN.subn("[PHONE]", text)
+        return new_text, count > 0
 
     def _replace_names(self, text: str) -> tuple[str, bool]:
         """Replace names following identity phrases with [NAME].
@@ -111,16 +136,12 @@ class Anonymizer:
         Returns:
             Tuple of (modified text, whether any names were found).
         """
-        found = False
-
         def _replace_match(match: re.Match) -> str:
-            nonlocal found
-            found = True
             prefix = match.group(0)[: match.start(1) - match.start(0)]
             return f"{prefix}[NAME]"
 
-        new_text = _NAME_PATTERN.sub(_replace_match, text)
-        return new_text, found
+        new_text, count = _NAME_PATTERN.subn(_replace_match, text)
+        return new_text, count > 0
 
     def _replace_addresses(self, text: str) -> tuple[str, bool]:
         """Replace street addresses with [ADDRESS].
@@ -131,5 +152,5 @@ class Anonymizer:
         Returns:
             Tuple of (modified text, whether any addresses were found).
         """
-        new_text = _ADDRESS_PATTERN.sub("[ADDRESS]", text)
-        return new_text, new_text != text
+        new_text, count = _ADDRESS_PATTERN.subn("[ADDRESS]", text)
+        return new_text, count > 0
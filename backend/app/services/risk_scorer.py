@@ -10,10 +10,12 @@ Computes a risk score (0-100) for each user message by combining:
 All thresholds are loaded from Settings configuration.
 """
 
-import json
 import logging
+import string
 from pathlib import Path
 
+import orjson
+
 from app.config import get_settings
 from app.exceptions import RiskScoringException
 from app.models.enums import RiskLevel
@@ -58,6 +60,9 @@ NEGATIVE_SENTIMENT_WORDS: list[str] = [
     "hate", "disgusting", "pathetic", "failure", "stupid",
 ]
 
+# Tiers that can force a minimum score, highest priority first
+TIER_OVERRIDE_PRIORITY: tuple[str, ...] = ("critical", "severe", "moderate")
+
 # Points per negative sentiment word found
 SENTIMENT_POINTS_PER_WORD = 5
 
@@ -73,23 +78,99 @@ ESCALATION_PHRASES: list[str] = [
     "no one understands",
 ]
 
+# Byte sets deleted by bytes.translate to count letters in ASCII messages
+_ASCII_LETTERS = string.ascii_letters.encode()
+_ASCII_UPPERCASE = string.ascii_uppercase.encode()
+
+
+def _count_letters(message: str) -> tuple[int, int]:
+    """Count alphabetic and uppercase alphabetic characters in a message.
+
+    ASCII messages are counted with bytes.translate, which runs entirely in
+    C; other messages fall back to a per-character scan.
+
+    Args:
+        message: Original (non-lowercased) user message.
+
+    Returns:
+        Tuple of (letter count, uppercase letter count).
+    """
+    if message.isascii():
+        raw = message.encode("ascii")
+        return (
+            len(raw) - len(raw.translate(None, _ASCII_LETTERS)),
+            len(raw) - len(raw.translate(None, _ASCII_UPPERCASE)),
+        )
+    alpha_count = upper_count = 0
+    for char in message:
+        if char.isalpha():
+            alpha_count += 1
+            if char.isupper():
+                upper_count += 1
+    return alpha_count, upper_count
+
+
+def load_risk_keywords(path: str | Path) -> dict:
+    """Load risk keyword tiers from a JSON file.
+
+    Args:
+        path: Location of the keywords file.
+
+    Returns:
+        Dictionary of keyword tiers with weights and keyword lists.
+
+    Raises:
+        RiskScoringException: If the keywords file cannot be loaded.
+    """
+    path = Path(path)
+    try:
+        return orjson.loads(path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError) as exc:
+        raise RiskScoringException(
+            message=f"Failed to load risk keywords from {path}: {exc}",
+        ) from exc
+
 
 class RiskScorer:
     """Computes multi-signal risk scores for user messages.
 
-    Loads keyword data from a JSON file and combines five independent
-    signals into a composite score capped at 100.
+    Combines five independent signals into a composite score capped at 100.
+
+    Args:
+        keywords: Preloaded keyword tiers; read from the configured
+            JSON file when omitted.
     """
 
-    def __init__(self) -> None:
-        self._keywords = self._load_keywords()
+    def __init__(self, keywords: dict | None = None) -> None:
+        settings = get_settings()
+        if keywords is None:
+            keywords = load_risk_keywords(settings.risk_keywords_path)
+        self._keywords = keywords
+        # Risk-level cut-offs, also the score floors for critical and severe keywords
+        self._threshold_critical = settings.risk_threshold_critical
+        self._threshold_high = settings.risk_threshold_high
+        # (tier name, weight, keywords) resolved once instead of per message,
+        # heaviest tier first so a capped match can end the scan early
+        self._keyword_tiers: tuple[tuple[str, int, tuple[str, ...]], ...] = tuple(
+            sorted(
+                (
+                    (tier_name, tier_data["weight_max"], tuple(tier_data["keywords"]))
+                    for tier_name, tier_data in keywords.items()
+                ),
+                key=lambda tier: tier[1],
+                reverse=True,
+            )
+        )
 
-    def compute(self, message: str, session: Session) -> int:
+    def compute(
+        self, message: str, session: Session, lower_message: str | None = None,
+    ) -> int:
         """Compute a risk score (0-100) for a user message.
 
         Args:
             message: The user's message text.
             session: Current session for history-based scoring.
+            lower_message: message.lower(), if the caller already has it.
 
         Returns:
             Integer risk score between 0 and 100.
@@ -98,9 +179,10 @@ class RiskScorer:
             RiskScoringException: If scoring computation fails.
         """
         try:
-            lower_message = message.lower()
+            if lower_message is None:
+                lower_message = message.lower()
 
-            keyword_score = self._score_keywords(lower_message)
+            keyword_score, matched_tier = self._score_keywords(lower_message)
             sentiment_score = self._score_sentiment(lower_message)
             behavioral_score = self._score_behavioral(message)
             escalation_score = self._score_escalation(lower_message)
@@ -115,13 +197,12 @@ class RiskScorer:
             # Critical keyword override: safety-critical keywords must
             # always reach the corresponding threshold regardless of
             # other signals, to guarantee triage activation.
-            matched_tier = self._match_keyword_tier(lower_message)
-            settings = get_settings()
             if matched_tier == "critical":
-                total = max(total, settings.risk_threshold_critical)
+                total = max(total, self._threshold_critical)
             elif matched_tier == "severe":
-                total = max(total, settings.risk_threshold_high)
+                total = max(total, self._threshold_high)
 
+            # One summary per message; the scan loops themselves do not log
             logger.debug(
                 "Risk signals: keyword=%d, sentiment=%d, behavioral=%d, "
                 "escalation=%d, history=%d, tier_override=%s",
@@ -149,57 +230,50 @@ class RiskScorer:
         Returns:
             RiskLevel classification.
         """
-        settings = get_settings()
-        if score >= settings.risk_threshold_critical:
+        if score >= self._threshold_critical:
             return RiskLevel.CRITICAL
-        if score >= settings.risk_threshold_high:
+        if score >= self._threshold_high:
             return RiskLevel.HIGH
         # Medium: 30-59 (below high threshold, above low)
         if score >= 30:
             return RiskLevel.MEDIUM
         return RiskLevel.LOW
 
-    def _match_keyword_tier(self, lower_message: str) -> str | None:
-        """Return the highest severity tier matched, or None.
-
-        Args:
-            lower_message: Lowercased user message.
-
-        Returns:
-            Tier name ('critical', 'severe', 'moderate') or None.
-        """
-        tier_priority = ["critical", "severe", "moderate"]
-        for tier_name in tier_priority:
-            if tier_name not in self._keywords:
-                continue
-            for keyword in self._keywords[tier_name]["keywords"]:
-                if keyword in lower_message:
-                    return tier_name
-        return None
-
-    def _score_keywords(self, lower_message: str) -> int:
-        """Score based on keyword severity tier matches (max 30).
+    def _score_keywords(self, lower_message: str) -> tuple[int, str | None]:
+        """Score keyword tier matches (max 30) and find the override tier.
 
-        Takes the HIGHEST matching weight, not cumulative.
+        Takes the HIGHEST matching weight, not cumulative. Each tier is
+        scanned once and the result feeds both the score and the override.
+        Scanning stops once the score is capped and the top-priority
+        override tier has matched, since neither result can change.
 
         Args:
             lower_message: Lowercased user message.
 
         Returns:
-            Keyword score capped at MAX_KEYWORD_SCORE.
+            Tuple of (keyword score capped at MAX_KEYWORD_SCORE, highest
+            priority tier matched from TIER_OVERRIDE_PRIORITY or None).
         """
         highest_weight = 0
-        for tier_name, tier_data in self._keywords.items():
-            weight = tier_data["weight_max"]
-            for keyword in tier_data["keywords"]:
+        matched_tiers: list[str] = []
+        for tier_name, weight, keywords in self._keyword_tiers:
+            for keyword in keywords:
                 if keyword in lower_message:
                     highest_weight = max(highest_weight, weight)
-                    logger.debug(
-                        "Keyword match: tier=%s, keyword_found=true, weight=%d",
-                        tier_name, weight,
-                    )
+                    matched_tiers.append(tier_name)
                     break
-        return min(highest_weight, MAX_KEYWORD_SCORE)
+            if (
+                highest_weight >= MAX_KEYWORD_SCORE
+                and TIER_OVERRIDE_PRIORITY[0] in matched_tiers
+            ):
+                break
+
+        matched_tier = None
+        for tier_name in TIER_OVERRIDE_PRIORITY:
+            if tier_name in matched_tiers:
+                matched_tier = tier_name
+                break
+        return min(highest_weight, MAX_KEYWORD_SCORE), matched_tier
 
     def _score_sentiment(self, lower_message: str) -> int:
         """Score based on negative sentiment word count (max 20).
@@ -233,9 +307,9 @@ class RiskScorer:
         if exclamation_question_count >= PUNCTUATION_THRESHOLD:
             score += PUNCTUATION_POINTS
 
-        alpha_chars = [c for c in message if c.isalpha()]
-        if alpha_chars:
-            upper_ratio = sum(1 for c in alpha_chars if c.isupper()) / len(alpha_chars)
+        alpha_count, upper_count = _count_letters(message)
+        if alpha_count:
+            upper_ratio = upper_count / alpha_count
             if upper_ratio > CAPS_RATIO_THRESHOLD:
                 score += CAPS_POINTS
 
@@ -254,7 +328,6 @@ class RiskScorer:
         """
         for phrase in ESCALATION_PHRASES:
             if phrase in lower_message:
-                logger.debug("Escalation phrase detected")
                 return MAX_ESCALATION_SCORE
         return 0
 
@@ -276,28 +349,11 @@ class RiskScorer:
         if session.cumulative_risk > CUMULATIVE_RISK_THRESHOLD:
             return CUMULATIVE_HISTORY_POINTS
 
-        if len(session.risk_scores) >= MIN_MESSAGES_FOR_AVERAGE:
-            avg = sum(session.risk_scores) / len(session.risk_scores)
+        # Running totals kept by Session; no pass over the history needed
+        scored_count = session.scored_message_count
+        if scored_count >= MIN_MESSAGES_FOR_AVERAGE:
+            avg = session.cumulative_risk / scored_count
             if avg > AVERAGE_RISK_THRESHOLD:
                 return AVERAGE_HISTORY_POINTS
 
         return 0
-
-    def _load_keywords(self) -> dict:
-        """Load risk keywords from the configured JSON file.
-
-        Returns:
-            Dictionary of keyword tiers with weights and keyword lists.
-
-        Raises:
-            RiskScoringException: If the keywords file cannot be loaded.
-        """
-        settings = get_settings()
-        path = Path(settings.risk_keywords_path)
-        try:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as exc:
-            raise RiskScoringException(
-                message=f"Failed to load risk keywords from {path}: {exc}",
-            ) from exc
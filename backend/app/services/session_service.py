@@ -5,11 +5,11 @@ and duration monitoring. Delegates storage to the repository layer.
 """
 
 import logging
-from datetime import datetime, timezone
+import time
 
 from app.exceptions import SessionExpiredException, SessionNotFoundException
 from app.config import get_settings
-from app.models.enums import RiskLevel
+from app.models.enums import MessageRole, RiskLevel
 from app.models.session import Session
 from app.repositories.memory_session import InMemorySessionRepository
 
@@ -25,6 +25,7 @@ class SessionService:
 
     def __init__(self, repository: InMemorySessionRepository) -> None:
         self._repository = repository
+        self._max_age_seconds = get_settings().max_session_duration_minutes * 60.0
 
     def get_or_create(self, session_id: str | None) -> Session:
         """Retrieve an existing session or create a new one.
@@ -77,7 +78,7 @@ class SessionService:
         Returns:
             The updated session.
         """
-        session.add_message(role="user", content=content, risk_score=risk_score)
+        session.add_message(role=MessageRole.USER, content=content, risk_score=risk_score)
         session.update_risk(risk_level)
         self._repository.update(session)
         logger.info(
@@ -98,7 +99,7 @@ class SessionService:
         Returns:
             The updated session.
         """
-        session.add_message(role="assistant", content=content)
+        session.add_message(role=MessageRole.ASSISTANT, content=content)
         self._repository.update(session)
         return session
 
@@ -147,8 +148,6 @@ class SessionService:
         Raises:
             SessionExpiredException: If the session has expired.
         """
-        settings = get_settings()
-        now = datetime.now(timezone.utc)
-        elapsed = (now - session.created_at).total_seconds() / 60.0
-        if elapsed > settings.max_session_duration_minutes:
-            raise SessionExpiredException(session.id, elapsed)
+        elapsed_seconds = time.time() - session.created_at_ts
+        if elapsed_seconds > self._max_age_seconds:
+            raise SessionExpiredException(session.id, elapsed_seconds / 60.0)
@@ -7,11 +7,12 @@ and what crisis resources to provide.
 Rules are evaluated in strict order — first match wins.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import orjson
+
 from app.config import get_settings
 from app.exceptions import TriageException
 from app.models.enums import HandoffReason, RiskLevel
@@ -67,7 +68,7 @@ RESPONSE_LONG_SESSION = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageResult:
     """Result of triage evaluation for a single message.
 
@@ -86,15 +87,48 @@ class TriageResult:
     handoff_reason: HandoffReason | None = None
 
 
+def load_crisis_resources(path: str | Path) -> list[CrisisResource]:
+    """Load crisis resources from a JSON file.
+
+    Args:
+        path: Location of the crisis resources file.
+
+    Returns:
+        List of CrisisResource objects.
+
+    Raises:
+        TriageException: If the resources file cannot be loaded.
+    """
+    path = Path(path)
+    try:
+        data = orjson.loads(path.read_bytes())
+        return [CrisisResource(**item) for item in data]
+    except (FileNotFoundError, orjson.JSONDecodeError) as exc:
+        raise TriageException(
+            message=f"Failed to load crisis resources from {path}: {exc}",
+        ) from exc
+
+
 class TriageEvaluator:
     """Evaluates messages against triage rules in priority order.
 
     Rules are checked sequentially; the first matching rule determines
     the triage outcome. This ensures deterministic, auditable behavior.
+
+    Args:
+        crisis_resources: Preloaded crisis resources; read from the
+            configured JSON file when omitted.
     """
 
-    def __init__(self) -> None:
-        self._crisis_resources = self._load_crisis_resources()
+    def __init__(self, crisis_resources: list[CrisisResource] | None = None) -> None:
+        settings = get_settings()
+        if crisis_resources is None:
+            crisis_resources = load_crisis_resources(settings.crisis_resources_path)
+        self._crisis_resources = crisis_resources
+        # Escalation thresholds and the check-in message limit, copied from settings
+        self._threshold_critical = settings.risk_threshold_critical
+        self._threshold_high = settings.risk_threshold_high
+        self._max_messages_before_checkin = settings.session_max_messages_before_checkin
 
     def evaluate(
         self,
@@ -102,6 +136,7 @@ class TriageEvaluator:
         risk_score: int,
         risk_level: RiskLevel,
         session: Session,
+        lower_message: str | None = None,
     ) -> TriageResult:
         """Evaluate a message against all triage rules.
 
@@ -110,6 +145,7 @@ class TriageEvaluator:
             risk_score: Computed risk score (0-100).
             risk_level: Classified risk level.
             session: Current session state.
+            lower_message: message.lower(), if the caller already has it.
 
         Returns:
             TriageResult with the evaluation outcome.
@@ -118,7 +154,10 @@ class TriageEvaluator:
             TriageException: If evaluation fails.
         """
         try:
-            result = self._check_user_requests_human(message)
+            if lower_message is None:
+                lower_message = message.lower()
+
+            result = self._check_user_requests_human(lower_message)
             if result is not None:
                 logger.info(
                     "Triage rule matched: user_requested, session_id=%s",
@@ -162,16 +201,15 @@ class TriageEvaluator:
                 session_id=session.id,
             ) from exc
 
-    def _check_user_requests_human(self, message: str) -> TriageResult | None:
+    def _check_user_requests_human(self, lower_message: str) -> TriageResult | None:
         """Rule 1: User explicitly requests to speak with a human.
 
         Args:
-            message: User's message text.
+            lower_message: Lowercased user message.
 
         Returns:
             TriageResult if matched, None otherwise.
         """
-        lower_message = message.lower()
         for phrase in HUMAN_REQUEST_PHRASES:
             if phrase in lower_message:
                 return TriageResult(
@@ -194,8 +232,7 @@ class TriageEvaluator:
         Returns:
             TriageResult if matched, None otherwise.
         """
-        settings = get_settings()
-        if risk_score >= settings.risk_threshold_critical:
+        if risk_score >= self._threshold_critical:
             return TriageResult(
                 triage_activated=True,
                 human_handoff=True,
@@ -217,8 +254,7 @@ class TriageEvaluator:
         Returns:
             TriageResult if matched, None otherwise.
         """
-        settings = get_settings()
-        if risk_score >= settings.risk_threshold_high:
+        if risk_score >= self._threshold_high:
             return TriageResult(
                 triage_activated=True,
                 human_handoff=True,
@@ -238,9 +274,8 @@ class TriageEvaluator:
         Returns:
             TriageResult if matched, None otherwise.
         """
-        settings = get_settings()
         if (
-            session.message_count >= settings.session_max_messages_before_checkin
+            session.message_count >= self._max_messages_before_checkin
             and not session.triage_activated
         ):
             return TriageResult(
@@ -249,23 +284,3 @@ class TriageEvaluator:
                 override_response=RESPONSE_LONG_SESSION,
             )
         return None
-
-    def _load_crisis_resources(self) -> list[CrisisResource]:
-        """Load crisis resources from the configured JSON file.
-
-        Returns:
-            List of CrisisResource objects.
-
-        Raises:
-            TriageException: If the resources file cannot be loaded.
-        """
-        settings = get_settings()
-        path = Path(settings.crisis_resources_path)
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            return [CrisisResource(**item) for item in data]
-        except (FileNotFoundError, json.JSONDecodeError) as exc:
-            raise TriageException(
-                message=f"Failed to load crisis resources from {path}: {exc}",
-            ) from exc
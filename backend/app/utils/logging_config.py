@@ -11,14 +11,33 @@ import sys
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Level applied by the last setup_logging() call, None until first call
+_configured_level: int | None = None
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure the root logger with structured formatting.
 
+    Repeated calls with the same level (e.g. one app created per test)
+    are no-ops, so handlers are only rebuilt when the level changes.
+
     Args:
         level: Logging level string (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
+    global _configured_level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
+    if numeric_level == _configured_level:
+        return
+    _configured_level = numeric_level
+
+    # LOG_FORMAT uses none of the caller, thread, process or task fields, so
+    # skip collecting them for every record (see "Optimization" in the
+    # logging HOWTO); _srcfile = None turns off the findCaller frame walk
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+    logging._srcfile = None
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(numeric_level)
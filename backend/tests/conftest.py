@@ -2,7 +2,8 @@
 
 Provides reusable fixtures for test sessions, service instances,
 and the FastAPI test client. All fixtures are function-scoped
-by default for test isolation.
+by default for test isolation; only the read-only data files and
+the stateless scoring services are built once per test run and shared.
 """
 
 import os
@@ -13,21 +14,16 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.config import Settings, get_settings
-from app.dependencies import (
-    get_chatbot_service,
-    get_risk_scorer,
-    get_session_repository,
-    get_session_service,
-    get_triage_evaluator,
-)
+from app.dependencies import build_container, get_container
 from app.main import create_app
 from app.models.enums import RiskLevel, TriageStatus
+from app.models.schemas import CrisisResource
 from app.models.session import Session
 from app.repositories.memory_session import InMemorySessionRepository
 from app.services.chatbot import ChatbotService
-from app.services.risk_scorer import RiskScorer
+from app.services.risk_scorer import RiskScorer, load_risk_keywords
 from app.services.session_service import SessionService
-from app.services.triage_evaluator import TriageEvaluator
+from app.services.triage_evaluator import TriageEvaluator, load_crisis_resources
 
 
 @pytest.fixture
@@ -48,16 +44,28 @@ def session_service(session_repository: InMemorySessionRepository) -> SessionSer
     return SessionService(repository=session_repository)
 
 
-@pytest.fixture
-def risk_scorer() -> RiskScorer:
-    """Provide a risk scorer instance."""
-    return RiskScorer()
+@pytest.fixture(scope="session")
+def risk_keywords() -> dict:
+    """Load the risk keyword tiers once for the whole test run."""
+    return load_risk_keywords(get_settings().risk_keywords_path)
 
 
-@pytest.fixture
-def triage_evaluator() -> TriageEvaluator:
-    """Provide a triage evaluator instance."""
-    return TriageEvaluator()
+@pytest.fixture(scope="session")
+def crisis_resources() -> list[CrisisResource]:
+    """Load the crisis resources once for the whole test run."""
+    return load_crisis_resources(get_settings().crisis_resources_path)
+
+
+@pytest.fixture(scope="session")
+def risk_scorer(risk_keywords: dict) -> RiskScorer:
+    """Provide a shared risk scorer; it holds no per-session state."""
+    return RiskScorer(keywords=risk_keywords)
+
+
+@pytest.fixture(scope="session")
+def triage_evaluator(crisis_resources: list[CrisisResource]) -> TriageEvaluator:
+    """Provide a shared triage evaluator; it holds no per-session state."""
+    return TriageEvaluator(crisis_resources=crisis_resources)
 
 
 @pytest.fixture
@@ -114,20 +122,18 @@ def create_session(
 
 
 @pytest.fixture
-def app():
+def app(risk_keywords: dict, crisis_resources: list[CrisisResource]):
     """Provide a fresh FastAPI app with isolated dependencies."""
     application = create_app()
 
-    repo = InMemorySessionRepository()
-
-    def override_repo():
-        return repo
+    container = build_container(
+        risk_keywords=risk_keywords, crisis_resources=crisis_resources,
+    )
 
-    def override_session_service():
-        return SessionService(repository=repo)
+    def override_container():
+        return container
 
-    application.dependency_overrides[get_session_repository] = override_repo
-    application.dependency_overrides[get_session_service] = override_session_service
+    application.dependency_overrides[get_container] = override_container
 
     return application
 
@@ -47,6 +47,11 @@ class TestAnonymizer:
         result = self.anonymizer.anonymize(text)
         assert result == text
 
+    def test_pii_free_text_is_returned_as_is(self) -> None:
+        """Messages that cannot hold PII should skip the replacement passes."""
+        text = "how are you feeling today"
+        assert self.anonymizer.anonymize(text) is text
+
     def test_masks_ten_digit_phone(self) -> None:
         """Plain 10-digit numbers should be replaced with [PHONE]."""
         text = "Call me at 5512345678"
@@ -59,3 +64,18 @@ class TestAnonymizer:
         result = self.anonymizer.anonymize(text)
         assert "[ADDRESS]" in result
         assert "123 Main Street" not in result
+
+    def test_masks_name_with_case_folded_phrase(self) -> None:
+        """Identity phrases should be caught regardless of letter case."""
+        result = self.anonymizer.anonymize("MY NAME IS Carlos")
+        assert result == "MY NAME IS [NAME]"
+
+    def test_address_pattern_handles_long_words(self) -> None:
+        """A long letter run after a number must not trigger runaway backtracking."""
+        text = "1 " + "a" * 1990
+        assert self.anonymizer.anonymize(text) == text
+
+    def test_masks_multi_word_address(self) -> None:
+        """Street names of several words should be masked as one address."""
+        result = self.anonymizer.anonymize("We moved to 42 Old Mill Creek Road today")
+        assert result == "We moved to [ADDRESS] today"
@@ -3,10 +3,29 @@
 Tests the full request/response cycle through the FastAPI application.
 """
 
-import pytest
+import asyncio
+import json
+from contextlib import asynccontextmanager
 
+import pytest
 from httpx import AsyncClient
 
+from app import main
+from app.exceptions import (
+    InvalidMessageException,
+    SessionExpiredException,
+    SessionNotFoundException,
+)
+from app.main import (
+    create_app,
+    invalid_message_handler,
+    session_expired_handler,
+    session_not_found_handler,
+)
+from app.models.schemas import SessionHistoryResponse
+from app.routers.chat import _coalesce_tokens
+from app.services.chatbot import ChatbotService
+
 
 @pytest.mark.asyncio
 class TestHealthEndpoint:
@@ -28,6 +47,19 @@ class TestHealthEndpoint:
         assert isinstance(data["active_sessions"], int)
 
 
+@pytest.mark.asyncio
+class TestOpenAPI:
+    """Tests for the generated OpenAPI document."""
+
+    async def test_openapi_documents_chat_request_body(self, test_client: AsyncClient) -> None:
+        """The manually validated chat body should still appear in the schema."""
+        response = await test_client.get("/openapi.json")
+        assert response.status_code == 200
+        operation = response.json()["paths"]["/api/v1/chat/"]["post"]
+        schema = operation["requestBody"]["content"]["application/json"]["schema"]
+        assert "user_message" in schema["properties"]
+
+
 @pytest.mark.asyncio
 class TestChatEndpoint:
     """Tests for POST /api/v1/chat/."""
@@ -91,6 +123,68 @@ class TestChatEndpoint:
         assert data["triage_activated"] is True
         assert data["human_handoff"] is True
 
+    async def test_chat_rejects_empty_message(self, test_client: AsyncClient) -> None:
+        """Invalid request bodies should return 422 with body-scoped errors."""
+        response = await test_client.post(
+            "/api/v1/chat/",
+            json={"user_message": ""},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "user_message"]
+
+
+@pytest.mark.asyncio
+class TestStreamEndpoint:
+    """Tests for POST /api/v1/chat/stream."""
+
+    @staticmethod
+    def _events(body: str) -> list[dict]:
+        return [
+            json.loads(line[len("data: "):])
+            for line in body.split("\n\n")
+            if line.startswith("data: ")
+        ]
+
+    async def test_stream_emits_metadata_tokens_and_done(self, test_client: AsyncClient) -> None:
+        """A normal message should stream metadata, its tokens, then done."""
+        response = await test_client.post(
+            "/api/v1/chat/stream",
+            json={"user_message": "Hello"},
+        )
+        events = self._events(response.text)
+        assert events[0]["type"] == "metadata"
+        assert events[-1] == {"type": "done", "session_message_count": 2}
+        assert any(event["type"] == "token" and event["content"] for event in events)
+
+    async def test_override_response_is_batched(self, test_client: AsyncClient) -> None:
+        """Triage overrides should arrive in multi-word frames that rebuild the text."""
+        response = await test_client.post(
+            "/api/v1/chat/stream",
+            json={"user_message": "I want to kill myself, i give up, everything is hopeless"},
+        )
+        events = self._events(response.text)
+        tokens = [event["content"] for event in events if event["type"] == "token"]
+        text = "".join(tokens)
+        assert len(tokens) < len(text.split(" "))
+
+        session_id = events[0]["session_id"]
+        history = await test_client.get(f"/api/v1/chat/{session_id}/history")
+        assert history.json()["history"][-1]["content"] == text
+
+    async def test_buffered_tokens_flush_while_upstream_stalls(self) -> None:
+        """Buffered tokens should be sent when the upstream pauses mid-stream."""
+        resume = asyncio.Event()
+
+        async def tokens():
+            yield "a"
+            await resume.wait()
+            yield "b"
+
+        batches = _coalesce_tokens(tokens())
+        assert await asyncio.wait_for(anext(batches), timeout=1) == "a"
+        resume.set()
+        assert [batch async for batch in batches] == ["b"]
+
 
 @pytest.mark.asyncio
 class TestHistoryEndpoint:
@@ -109,11 +203,34 @@ class TestHistoryEndpoint:
         data = history_response.json()
         assert len(data["history"]) == 2  # user message + bot response
         assert data["message_count"] == 2
+        assert [m["role"] for m in data["history"]] == ["user", "assistant"]
+        assert data["history"][1]["risk_score"] is None
+        SessionHistoryResponse.model_validate(data)
+
+    async def test_history_includes_messages_added_after_first_read(
+        self, test_client: AsyncClient,
+    ) -> None:
+        """Cached history entries should be extended with new messages."""
+        chat_response = await test_client.post(
+            "/api/v1/chat/",
+            json={"user_message": "Hello there"},
+        )
+        session_id = chat_response.json()["session_id"]
+        await test_client.get(f"/api/v1/chat/{session_id}/history")
+
+        await test_client.post(
+            "/api/v1/chat/",
+            json={"session_id": session_id, "user_message": "Still here"},
+        )
+        data = (await test_client.get(f"/api/v1/chat/{session_id}/history")).json()
+        assert data["message_count"] == 4
+        assert [m["content"] for m in data["history"]][::2] == ["Hello there", "Still here"]
 
     async def test_history_404_for_unknown_session(self, test_client: AsyncClient) -> None:
         """History for unknown session should return 404."""
         response = await test_client.get("/api/v1/chat/unknown_session/history")
         assert response.status_code == 404
+        assert response.json()["error_code"] == "SESSION_NOT_FOUND"
 
 
 @pytest.mark.asyncio
@@ -136,3 +253,84 @@ class TestHandoffEndpoint:
         assert data["handoff_status"] == "initiated"
         assert "professional_context" in data
         assert "message_count" in data["professional_context"]
+
+    async def test_handoff_404_matches_other_routes(self, test_client: AsyncClient) -> None:
+        """Unknown sessions should get the same 404 body on every route."""
+        handoff = await test_client.post("/api/v1/chat/unknown_session/handoff")
+        history = await test_client.get("/api/v1/chat/unknown_session/history")
+        assert handoff.status_code == 404
+        assert handoff.json() == history.json()
+
+
+@pytest.mark.asyncio
+class TestExceptionHandlers:
+    """Tests for the module-level custom exception handlers."""
+
+    async def test_session_not_found_body(self) -> None:
+        """Unknown sessions should map to a constant 404 body."""
+        response = await session_not_found_handler(None, SessionNotFoundException("sess_x"))
+        assert response.status_code == 404
+        assert json.loads(response.body) == {
+            "detail": "Session not found",
+            "error_code": "SESSION_NOT_FOUND",
+        }
+
+    async def test_session_expired_body(self) -> None:
+        """Expired sessions should map to 410 with the session in the detail."""
+        response = await session_expired_handler(None, SessionExpiredException("sess_x", 61.0))
+        assert response.status_code == 410
+        assert json.loads(response.body) == {
+            "detail": "Session expired: sess_x",
+            "error_code": "SESSION_EXPIRED",
+        }
+
+    async def test_invalid_message_detail_is_escaped(self) -> None:
+        """User-controlled detail text should still produce valid JSON."""
+        response = await invalid_message_handler(None, InvalidMessageException('bad "quote"'))
+        assert response.status_code == 400
+        assert json.loads(response.body)["detail"] == 'Invalid message: bad "quote"'
+
+
+@pytest.mark.asyncio
+class TestLifespan:
+    """Tests for the application lifespan and sub-lifespan composition."""
+
+    async def test_startup_builds_container(self) -> None:
+        """Startup should preload data and build the service container."""
+        application = create_app()
+        async with main.lifespan(application):
+            assert application.state.container.risk_scorer is not None
+            assert len(application.state.crisis_resources) > 0
+
+    async def test_sub_lifespans_enter_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A sub-lifespan registered twice should still run exactly once."""
+        events: list[str] = []
+
+        @asynccontextmanager
+        async def sub_lifespan(app):
+            events.append("start")
+            yield
+            events.append("stop")
+
+        monkeypatch.setattr(main, "_SUB_LIFESPANS", [])
+        main.register_sub_lifespan(sub_lifespan)
+        main.register_sub_lifespan(sub_lifespan)
+
+        async with main.lifespan(create_app()):
+            assert events == ["start"]
+        assert events == ["start", "stop"]
+
+    async def test_shutdown_error_still_closes_client(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The chatbot client should be closed even if shutdown raises."""
+        closed: list[bool] = []
+
+        async def aclose(self) -> None:
+            closed.append(True)
+
+        monkeypatch.setattr(ChatbotService, "aclose", aclose)
+        with pytest.raises(RuntimeError):
+            async with main.lifespan(create_app()):
+                raise RuntimeError("server crashed")
+        assert closed == [True]
@@ -5,7 +5,14 @@ Tests mock response patterns and safety validation rules.
 
 import pytest
 
-from app.services.chatbot import ChatbotService, ResponseValidator
+from app.config import get_settings
+from app.services.chatbot import (
+    MAX_CONTEXT_MESSAGES,
+    SYSTEM_PROMPT,
+    ChatbotService,
+    ResponseValidator,
+    _build_messages,
+)
 
 from tests.conftest import create_session
 
@@ -63,6 +70,33 @@ class TestChatbotMockResponses:
         )
         assert "sleep" in response.lower()
 
+    @pytest.mark.asyncio
+    async def test_shared_lowercase_ignored_after_anonymization(
+        self, chatbot_service: ChatbotService,
+    ) -> None:
+        """Keywords inside stripped PII must not steer the mock response."""
+        session = create_session(messages=2)
+        message = "My name is Hilda"
+        response = await chatbot_service.generate_response(
+            message, session, message.lower(),
+        )
+        assert "welcome back" not in response.lower()
+
+
+class TestBuildMessages:
+    """Tests for the LLM request message list."""
+
+    def test_system_prompt_then_recent_history_then_message(self) -> None:
+        """Messages should keep a fixed system prefix and append-only order."""
+        session = create_session(messages=MAX_CONTEXT_MESSAGES + 2)
+        messages = _build_messages("New message", session)
+        assert messages[0] == {"role": "system", "content": SYSTEM_PROMPT}
+        assert messages[0] is _build_messages("Other", session)[0]
+        assert messages[1] == {"role": "user", "content": "Test message 2"}
+        assert messages[-2] == {"role": "assistant", "content": "Response 11"}
+        assert messages[-1] == {"role": "user", "content": "New message"}
+        assert len(messages) == MAX_CONTEXT_MESSAGES + 2
+
 
 class TestResponseValidator:
     """Tests for ResponseValidator safety checks."""
@@ -91,3 +125,67 @@ class TestResponseValidator:
         safe_response = "I hear you. Can you tell me more about how you're feeling?"
         result = validator.validate(safe_response)
         assert result == safe_response
+
+
+class TestOpenAIClient:
+    """Tests for the shared OpenAI client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_until_closed(
+        self, chatbot_service: ChatbotService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The same client should serve every call until the service is closed."""
+        monkeypatch.setattr(get_settings(), "llm_api_key", "sk-test")
+        client = chatbot_service._get_client()
+        assert chatbot_service._get_client() is client
+        await chatbot_service.aclose()
+        assert chatbot_service._get_client() is not client
+        await chatbot_service.aclose()
+
+
+class TestStreamValidation:
+    """Tests for per-token validation of streamed responses."""
+
+    @staticmethod
+    async def _collect(
+        chatbot_service: ChatbotService, monkeypatch: pytest.MonkeyPatch, tokens: list[str],
+    ) -> list[str]:
+        async def fake_stream(message, session, settings):
+            try:
+                for token in tokens:
+                    yield token
+            finally:
+                closed.append(True)
+
+        closed: list[bool] = []
+
+        monkeypatch.setattr(get_settings(), "llm_provider", "openai")
+        monkeypatch.setattr(chatbot_service, "_openai_stream", fake_stream)
+        streamed = [
+            token
+            async for token in chatbot_service.stream_response("Hi", create_session())
+        ]
+        assert closed == [True]
+        return streamed
+
+    @pytest.mark.asyncio
+    async def test_blocked_pattern_across_tokens_stops_stream(
+        self, chatbot_service: ChatbotService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A pattern split over tokens should be caught and end the stream."""
+        streamed = await self._collect(
+            chatbot_service, monkeypatch, ["Maybe you ", "should ta", "ke a break", " now"],
+        )
+        assert streamed == [
+            "Maybe you ",
+            "should ta",
+            f"__REPLACE__{ResponseValidator.SAFE_FALLBACK}",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_safe_stream_passes_through(
+        self, chatbot_service: ChatbotService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Safe responses should be streamed token for token."""
+        tokens = ["I hear ", "you. ", "Tell me more."]
+        assert await self._collect(chatbot_service, monkeypatch, tokens) == tokens
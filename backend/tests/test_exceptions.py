@@ -0,0 +1,66 @@
+"""Unit tests for the custom exception hierarchy.
+
+Tests lazy messages, slot storage of fields, and pickling round-trips.
+"""
+
+import pickle
+
+import pytest
+
+from app.exceptions import (
+    ChatbotBaseException,
+    InvalidMessageException,
+    SessionExpiredException,
+    SessionNotFoundException,
+)
+
+
+class TestExceptions:
+    """Tests for ChatbotBaseException and request-path subclasses."""
+
+    def test_base_exception_without_details(self) -> None:
+        """An exception without details should render only its message."""
+        exc = ChatbotBaseException("Something failed")
+        assert exc.details is None
+        assert str(exc) == "Something failed"
+
+    def test_session_expired_message_and_details(self) -> None:
+        """Expired-session message and details should be built from its fields."""
+        exc = SessionExpiredException("sess_abc", 61.26)
+        assert exc.message == "Session expired: sess_abc"
+        assert exc.details == {"session_id": "sess_abc", "duration_minutes": 61.3}
+
+    def test_session_not_found_message_and_details(self) -> None:
+        """Missing-session details should carry the ID like the other subclasses."""
+        exc = SessionNotFoundException("sess_abc")
+        assert exc.message == "Session not found: sess_abc"
+        assert exc.details == {"session_id": "sess_abc"}
+        assert str(exc) == "Session not found: sess_abc | details={'session_id': 'sess_abc'}"
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            SessionNotFoundException("sess_abc"),
+            SessionExpiredException("sess_abc", 61.0),
+            InvalidMessageException("empty"),
+        ],
+    )
+    def test_request_path_exceptions_keep_fields_in_slots(
+        self, exc: ChatbotBaseException,
+    ) -> None:
+        """Request-path exceptions should store their fields in slots, not __dict__."""
+        assert exc.__dict__ == {}
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            SessionNotFoundException("sess_abc"),
+            SessionExpiredException("sess_abc", 61.0),
+            InvalidMessageException("empty"),
+        ],
+    )
+    def test_request_path_exceptions_pickle(self, exc: ChatbotBaseException) -> None:
+        """Exceptions should survive a pickle round-trip with the same message."""
+        restored = pickle.loads(pickle.dumps(exc))
+        assert type(restored) is type(exc)
+        assert restored.message == exc.message
@@ -49,6 +49,13 @@ class TestRiskScorerCompute:
         score_caps = risk_scorer.compute("I NEED HELP PLEASE NOW", session)
         assert score_caps > score_normal
 
+    def test_caps_behavioral_signal_non_ascii(self, risk_scorer: RiskScorer) -> None:
+        """Accented capitals should count toward the caps ratio too."""
+        session = create_session()
+        score_normal = risk_scorer.compute("ayúdame, qué hago", session)
+        score_caps = risk_scorer.compute("AYÚDAME, QUÉ HAGO", session)
+        assert score_caps > score_normal
+
     def test_long_message_behavioral_signal(self, risk_scorer: RiskScorer) -> None:
         """Long messages should trigger behavioral scoring."""
         session = create_session()
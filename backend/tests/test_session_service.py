@@ -3,11 +3,14 @@
 Tests session lifecycle: creation, retrieval, messages, and duration.
 """
 
+from array import array
+from datetime import UTC, datetime, timedelta
+
 import pytest
-from datetime import datetime, timezone, timedelta
 
 from app.exceptions import SessionExpiredException, SessionNotFoundException
-from app.models.enums import RiskLevel
+from app.models.enums import MessageRole, RiskLevel
+from app.models.session import Session
 from app.repositories.memory_session import InMemorySessionRepository
 from app.services.session_service import SessionService
 
@@ -47,12 +50,29 @@ class TestSessionService:
         session_service.add_user_message(session, "Very sad", 30, RiskLevel.MEDIUM)
         assert session.cumulative_risk == 50
         assert len(session.risk_scores) == 2
+        assert session.scored_message_count == 2
+
+    def test_risk_scores_skip_bot_messages(self, session_service: SessionService) -> None:
+        """risk_scores should list user scores only; the column keeps every row."""
+        session = session_service.get_or_create(None)
+        session_service.add_user_message(session, "I feel sad", 20, RiskLevel.LOW)
+        session_service.add_bot_message(session, "I hear you")
+        assert session.risk_scores == [20]
+        assert session.message_risk_scores == [20, None]
 
     def test_duration_calculation(self, session_service: SessionService) -> None:
         """Session duration should be non-negative."""
         session = session_service.get_or_create(None)
         assert session.duration_minutes >= 0
 
+    def test_duration_tracks_last_activity(self) -> None:
+        """Duration should span from creation to the most recent message."""
+        created = datetime.now(UTC) - timedelta(minutes=30)
+        session = Session(id="sess_duration", created_at=created)
+        assert session.duration_minutes == 0
+        session.add_message("user", "Still here", risk_score=5)
+        assert 29.9 < session.duration_minutes < 30.1
+
     def test_mark_triage_activated(self, session_service: SessionService) -> None:
         """mark_triage_activated should set the flag."""
         session = session_service.get_or_create(None)
@@ -64,3 +84,73 @@ class TestSessionService:
         session = session_service.get_or_create(None)
         session_service.mark_handoff(session)
         assert session.human_handoff is True
+
+    def test_history_views_match_messages(self, session_service: SessionService) -> None:
+        """Iterating a session should yield messages in order with their scores."""
+        session = session_service.get_or_create(None)
+        session_service.add_user_message(session, "Hello", 10, RiskLevel.LOW)
+        session_service.add_bot_message(session, "Hi there")
+        history = list(session)
+        assert [(m.role, m.content, m.risk_score) for m in history] == [
+            ("user", "Hello", 10),
+            ("assistant", "Hi there", None),
+        ]
+        assert history[-1].timestamp == session.last_activity
+        assert session.recent_messages(1) == history[-1:]
+
+    def test_recent_messages_beyond_ring_buffer(self) -> None:
+        """recent_messages should serve any limit, in order, past the ring size."""
+        session = Session(id="sess_recent")
+        for index in range(15):
+            session.add_message("user", f"message {index}", risk_score=index)
+        assert [m.content for m in session.recent_messages(3)] == [
+            "message 12", "message 13", "message 14",
+        ]
+        assert [m.risk_score for m in session.recent_messages(12)] == list(range(3, 15))
+        assert session.recent_messages(0) == []
+
+    def test_recent_messages_from_prefilled_columns(self) -> None:
+        """A session built with existing columns should serve its recent messages."""
+        session = Session(
+            id="sess_prefilled",
+            roles=[MessageRole.USER, MessageRole.ASSISTANT],
+            contents=["Hello", "Hi there"],
+            message_risk_scores=[5, None],
+            timestamps=array("d", [1_700_000_000.0, 1_700_000_001.0]),
+        )
+        assert session.recent_messages(2) == list(session)
+        assert session.recent_messages(1)[0].content == "Hi there"
+
+    def test_count_active_spans_all_shards(self, session_service: SessionService) -> None:
+        """count_active should include sessions from every repository shard."""
+        for _ in range(40):
+            session_service.get_or_create(None)
+        assert session_service.count_active() == 40
+
+    def test_expired_session_is_evicted_on_read(
+        self, session_repository: InMemorySessionRepository,
+    ) -> None:
+        """Reading an expired session should return None and drop it."""
+        created = datetime.now(UTC) - timedelta(hours=2)
+        session_repository.create(Session(id="sess_old", created_at=created))
+        assert session_repository.get("sess_old") is None
+        assert session_repository.count_active() == 0
+
+    def test_count_active_drops_expired_without_read(
+        self, session_repository: InMemorySessionRepository,
+    ) -> None:
+        """count_active should sweep expired sessions that were never read."""
+        created = datetime.now(UTC) - timedelta(hours=2)
+        session_repository.create(Session(id="sess_old", created_at=created))
+        session_repository.create(Session(id="sess_new"))
+        assert session_repository.count_active() == 1
+        assert session_repository.get("sess_new") is not None
+
+    def test_update_restores_evicted_session(
+        self, session_repository: InMemorySessionRepository,
+    ) -> None:
+        """update should write back a session that is no longer stored."""
+        session = session_repository.get_or_create(None)
+        session_repository.delete(session.id)
+        session_repository.update(session)
+        assert session_repository.get(session.id) is session